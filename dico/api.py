@@ -1,33 +1,25 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
 import datetime
+import functools
 import io
+import weakref
 from typing import TYPE_CHECKING, Awaitable, Dict, List, Optional, Type, Union
 
 from .base.http import EmptyObject, HTTPRequestBase
 from .model import (
-    BYTES_RESPONSE,
-    FILE_TYPE,
-    AllowedMentions,
     Application,
     ApplicationCommand,
-    ApplicationCommandOption,
-    ApplicationCommandPermissions,
-    ApplicationCommandTypes,
     ApplicationRoleConnection,
     ApplicationRoleConnectionMetadata,
-    Attachment,
     AuditLog,
-    AuditLogEvents,
-    AutoModerationEventTypes,
     AutoModerationRule,
     Ban,
     Channel,
-    ChannelTypes,
-    Component,
     Connection,
-    DefaultMessageNotificationLevel,
-    Embed,
     Emoji,
-    ExplicitContentFilterLevel,
     FollowedChannel,
     GetGateway,
     Guild,
@@ -35,47 +27,96 @@ from .model import (
     GuildMember,
     GuildPreview,
     GuildScheduledEvent,
-    GuildScheduledEventEntityMetadata,
-    GuildScheduledEventEntityTypes,
-    GuildScheduledEventPrivacyLevel,
-    GuildScheduledEventStatus,
     GuildScheduledEventUser,
     GuildTemplate,
     GuildWidget,
     GuildWidgetSettings,
     Integration,
     Interaction,
-    InteractionResponse,
     Invite,
-    InviteTargetTypes,
     ListThreadsResponse,
     Message,
     MessageReference,
     Onboarding,
-    OnboardingMode,
     Overwrite,
-    PermissionFlags,
-    PrivacyLevel,
     Role,
     Snowflake,
     StageInstance,
     Sticker,
-    SystemChannelFlags,
     ThreadMember,
-    TriggerTypes,
     User,
-    VerificationLevel,
-    VideoQualityModes,
     VoiceRegion,
     Webhook,
     WelcomeScreen,
-    WelcomeScreenChannel,
-    WidgetStyle,
 )
 from .utils import from_emoji, to_image_data, wrap_to_async
 
 if TYPE_CHECKING:
     from .base.model import AbstractObject, DiscordObjectBase
+    from .model import (
+        BYTES_RESPONSE,
+        FILE_TYPE,
+        AllowedMentions,
+        ApplicationCommandOption,
+        ApplicationCommandPermissions,
+        ApplicationCommandTypes,
+        Attachment,
+        AuditLogEvents,
+        AutoModerationEventTypes,
+        ChannelTypes,
+        Component,
+        DefaultMessageNotificationLevel,
+        Embed,
+        ExplicitContentFilterLevel,
+        GuildScheduledEventEntityMetadata,
+        GuildScheduledEventEntityTypes,
+        GuildScheduledEventPrivacyLevel,
+        GuildScheduledEventStatus,
+        InteractionResponse,
+        InviteTargetTypes,
+        OnboardingMode,
+        PermissionFlags,
+        PrivacyLevel,
+        SystemChannelFlags,
+        TriggerTypes,
+        VerificationLevel,
+        VideoQualityModes,
+        WelcomeScreenChannel,
+        WidgetStyle,
+    )
+
+
+def _normalize_files(files: List[FILE_TYPE]) -> List[io.FileIO]:
+    """Opens any file passed as path string, returning a new list."""
+    return [open(x, "rb") if isinstance(x, str) else x for x in files]
+
+
+def _normalize_attachments(attachments: List[Union[Attachment, dict]]) -> List[dict]:
+    """Converts attachments to their dict forms, returning a new list."""
+    return [x if isinstance(x, dict) else x.to_dict() for x in attachments]
+
+
+def _wrap_sync(cls, client: "APIClient", resp, **kwargs):
+    """Synchronous counterpart of :func:`~.utils.wrap_to_async`."""
+    if type(resp) is list:
+        return [cls.create(client, x, **kwargs) for x in resp]
+    return cls.create(client, resp, **kwargs)
+
+
+def _exclusive_params(*pairs: str):
+    """Raises TypeError when both keyword params of any given pair are passed."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for single, multiple in pairs:
+                if kwargs.get(single) and kwargs.get(multiple):
+                    raise TypeError(f"you can't pass both {single} and {multiple}.")
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
 
 
 class APIClient:
@@ -111,6 +152,20 @@ class APIClient:
     :ivar Optional[Snowflake] ~.application_id: ID of the application. Can be ``None``, and if it is, you must pass parameter application_id for all methods that requires it.
     """
 
+    __slots__ = (
+        "http",
+        "application",
+        "application_id",
+        "_default_allowed_mentions",
+        "_default_allowed_mentions_dict",
+        "_mk_user",
+        "_mk_webhook",
+        "_finalize_message",
+        "_wrapper_cache",
+        "edit_followup_message",
+        "__weakref__",
+    )
+
     def __init__(
         self,
         token: str,
@@ -118,16 +173,32 @@ class APIClient:
         base: Type[HTTPRequestBase],
         default_allowed_mentions: Optional[AllowedMentions] = None,
         application_id: Optional[Snowflake.TYPING] = None,
-        **http_options
+        **http_options,
     ):
         self.http: HTTPRequestBase = base.create(token, **http_options)
-        self.default_allowed_mentions: Optional[
-            AllowedMentions
-        ] = default_allowed_mentions
+        self.default_allowed_mentions = default_allowed_mentions
         self.application: Optional[Application] = None
         self.application_id: Optional[Snowflake] = Snowflake.ensure_snowflake(
             application_id
         )
+        self._mk_user = functools.partial(User.create, self)
+        self._mk_webhook = functools.partial(Webhook, self)
+        # The HTTP base never changes after construction, so the sync/async
+        # response split can be decided here once instead of per-request.
+        if asyncio.iscoroutinefunction(self.http.request):
+            self._finalize_message = functools.partial(wrap_to_async, Message, self)
+        else:
+            self._finalize_message = functools.partial(_wrap_sync, Message, self)
+        self._wrapper_cache: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        # Alias of edit_interaction_response; bound once instead of per-access.
+        self.edit_followup_message = self.edit_interaction_response
+
+    async def __aenter__(self) -> "APIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if asyncio.iscoroutinefunction(self.http.request):
+            await self.http.close()
 
     # Application Role Connection Metadata
 
@@ -137,7 +208,7 @@ class APIClient:
         resp = self.http.request_application_role_connection_metadata_records(
             int(application)
         )
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [ApplicationRoleConnectionMetadata(x) for x in resp]
         return wrap_to_async(
             ApplicationRoleConnectionMetadata, None, resp, as_create=False
@@ -149,7 +220,7 @@ class APIClient:
         resp = self.http.update_application_role_connection_metadata_records(
             int(application), data
         )
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [ApplicationRoleConnectionMetadata(x) for x in resp]
         return wrap_to_async(
             ApplicationRoleConnectionMetadata, None, resp, as_create=False
@@ -164,7 +235,7 @@ class APIClient:
         user: Optional[User.TYPING] = None,
         action_type: Optional[Union[int, AuditLogEvents]] = None,
         before: Optional["DiscordObjectBase.TYPING"] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
     ) -> AuditLog.RESPONSE:
         """
         Requests guild audit log.
@@ -185,7 +256,7 @@ class APIClient:
         resp = self.http.request_guild_audit_log(
             int(guild), user, action_type, before, limit
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return AuditLog(self, resp)
         return wrap_to_async(AuditLog, self, resp, as_create=False)
 
@@ -195,7 +266,7 @@ class APIClient:
         self, guild: Guild.TYPING
     ) -> AutoModerationRule.RESPONSE_AS_LIST:
         resp = self.http.list_auto_moderation_rule_for_guild(int(guild))
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [AutoModerationRule(x) for x in resp]
         return wrap_to_async(AutoModerationRule, None, resp, as_create=False)
 
@@ -205,7 +276,7 @@ class APIClient:
         resp = self.http.request_auto_moderation_rule(
             int(guild), int(auto_moderation_rule_id)
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return AutoModerationRule(resp)
         return wrap_to_async(AutoModerationRule, None, resp, as_create=False)
 
@@ -237,7 +308,7 @@ class APIClient:
         if exempt_channels is not None:
             body["exempt_channels"] = [int(x) for x in exempt_channels]
         resp = self.http.create_auto_moderation_rule(int(guild), **body, reason=reason)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return AutoModerationRule(resp)
         return wrap_to_async(AutoModerationRule, None, resp, as_create=False)
 
@@ -272,7 +343,7 @@ class APIClient:
         resp = self.http.modify_auto_moderation_rule(
             int(guild), int(auto_moderation_rule_id), **body, reason=reason
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return AutoModerationRule(resp)
         return wrap_to_async(AutoModerationRule, None, resp, as_create=False)
 
@@ -293,9 +364,9 @@ class APIClient:
         :return: :class:`~.Channel`
         """
         channel = self.http.request_channel(int(channel))
-        if isinstance(channel, dict):
-            return Channel.create(self, channel)
-        return wrap_to_async(Channel, self, channel)
+        if type(channel) is dict:
+            return self._reuse_or_create(Channel, channel)
+        return self._async_reuse_or_create(Channel, channel)
 
     def modify_guild_channel(
         self,
@@ -313,7 +384,7 @@ class APIClient:
         parent: Optional[Channel.TYPING] = EmptyObject,
         rtc_region: Optional[str] = EmptyObject,
         video_quality_mode: Optional[Union[int, VideoQualityModes]] = EmptyObject,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Channel.RESPONSE:
         """
         Modifies guild channel.
@@ -363,7 +434,7 @@ class APIClient:
             video_quality_mode,
             reason=reason,
         )
-        if isinstance(channel, dict):
+        if type(channel) is dict:
             return Channel.create(self, channel)
         return wrap_to_async(Channel, self, channel)
 
@@ -373,7 +444,7 @@ class APIClient:
         *,
         name: Optional[str] = None,
         icon: Optional[bytes] = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Channel.RESPONSE:
         """
         Modifies group DM channel.
@@ -387,7 +458,7 @@ class APIClient:
         channel = self.http.modify_group_dm_channel(
             int(channel), name, icon, reason=reason
         )
-        if isinstance(channel, dict):
+        if type(channel) is dict:
             return Channel.create(self, channel)
         return wrap_to_async(Channel, self, channel)
 
@@ -400,7 +471,7 @@ class APIClient:
         auto_archive_duration: Optional[int] = None,
         locked: Optional[bool] = None,
         rate_limit_per_user: Optional[int] = EmptyObject,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Channel.RESPONSE:
         """
         Modifies thread channel.
@@ -423,7 +494,7 @@ class APIClient:
             rate_limit_per_user,
             reason=reason,
         )
-        if isinstance(channel, dict):
+        if type(channel) is dict:
             return Channel.create(self, channel)
         return wrap_to_async(Channel, self, channel)
 
@@ -438,7 +509,7 @@ class APIClient:
         :return: :class:`~.Channel`
         """
         resp = self.http.delete_channel(int(channel), reason=reason)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Channel.create(self, resp, prevent_caching=True)
         return wrap_to_async(Channel, self, resp, prevent_caching=True)
 
@@ -449,7 +520,7 @@ class APIClient:
         around: Optional[Message.TYPING] = None,
         before: Optional[Message.TYPING] = None,
         after: Optional[Message.TYPING] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
     ) -> Message.RESPONSE_AS_LIST:
         """
         Requests list of messages in the channel.
@@ -468,10 +539,7 @@ class APIClient:
             after and str(int(after)),
             limit,
         )
-        # This looks unnecessary, but this is to ensure they are all numbers.
-        if isinstance(messages, list):
-            return [Message.create(self, x) for x in messages]
-        return wrap_to_async(Message, self, messages)
+        return self._finalize_message(messages)
 
     def request_channel_message(
         self, channel: Channel.TYPING, message: Message.TYPING
@@ -484,10 +552,16 @@ class APIClient:
         :return: :class:`~.Message`
         """
         message = self.http.request_channel_message(int(channel), int(message))
-        if isinstance(message, dict):
-            return Message.create(self, message)
-        return wrap_to_async(Message, self, message)
-
+        if type(message) is dict:
+            return self._reuse_or_create(Message, message)
+        return self._async_reuse_or_create(Message, message)
+
+    @_exclusive_params(
+        ("file", "files"),
+        ("embed", "embeds"),
+        ("component", "components"),
+        ("sticker", "stickers"),
+    )
     def create_message(
         self,
         channel: Channel.TYPING,
@@ -503,7 +577,7 @@ class APIClient:
         component: Optional[Union[dict, Component]] = None,
         components: Optional[List[Union[dict, Component]]] = None,
         sticker: Optional[Sticker.TYPING] = None,
-        stickers: Optional[List[Sticker.TYPING]] = None
+        stickers: Optional[List[Sticker.TYPING]] = None,
     ) -> Message.RESPONSE:
         """
         Creates message to channel.
@@ -539,64 +613,52 @@ class APIClient:
         :param Optional[List[Sticker]] stickers: Stickers of the message. Up to 3.
         :return: :class:`~.Message`
         """
-        if files and file:
-            raise TypeError("you can't pass both file and files.")
         if file:
             files = [file]
-        if files:
-            for x in range(len(files)):
-                sel = files[x]
-                if isinstance(sel, str):
-                    files[x] = open(sel, "rb")
-        if isinstance(message_reference, Message):
-            message_reference = MessageReference.from_message(message_reference)
-        if embed and embeds:
-            raise TypeError("you can't pass both embed and embeds.")
-        if embed:
-            embeds = [embed]
-        if embeds:
-            embeds = [x if isinstance(x, dict) else x.to_dict() for x in embeds]
-        if message_reference and not isinstance(message_reference, dict):
-            message_reference = message_reference.to_dict()
-        if component and components:
-            raise TypeError("you can't pass both component and components.")
-        if component:
-            components = [component]
-        if components:
-            components = [
-                *map(lambda n: n if isinstance(n, dict) else n.to_dict(), components)
-            ]
-        if sticker and stickers:
-            raise TypeError("you can't pass both sticker and stickers.")
-        if sticker:
-            stickers = [sticker]
-        if stickers:
-            stickers = [*map(int, stickers)]
-        params = {
-            "channel_id": int(channel),
-            "content": content,
-            "embeds": embeds,
-            "nonce": None,  # What does this do tho?
-            "message_reference": message_reference,
-            "tts": tts,
-            "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
-            "components": components,
-            "sticker_ids": stickers,
-        }
-        if files:
-            params["files"] = files
-        try:
+        with contextlib.ExitStack() as file_stack:
+            if files:
+                files = _normalize_files(files)
+                for x in files:
+                    file_stack.callback(x.close)
+            if isinstance(message_reference, Message):
+                message_reference = MessageReference.from_message(message_reference)
+            if embed:
+                embeds = [embed]
+            if embeds:
+                embeds = [x if isinstance(x, dict) else x.to_dict() for x in embeds]
+            if message_reference and not isinstance(message_reference, dict):
+                message_reference = message_reference.to_dict()
+            if component:
+                components = [component]
+            if components:
+                components = [
+                    *map(
+                        lambda n: n if isinstance(n, dict) else n.to_dict(), components
+                    )
+                ]
+            if sticker:
+                stickers = [sticker]
+            if stickers:
+                stickers = [*map(int, stickers)]
+            params = {
+                "channel_id": int(channel),
+                "content": content,
+                "embeds": embeds,
+                "nonce": None,  # What does this do tho?
+                "message_reference": message_reference,
+                "tts": tts,
+                "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
+                "components": components,
+                "sticker_ids": stickers,
+            }
+            if files:
+                params["files"] = files
             msg = (
                 self.http.create_message_with_files(**params)
                 if files
                 else self.http.create_message(**params)
             )
-            if isinstance(msg, dict):
-                return Message.create(self, msg)
-            return wrap_to_async(Message, self, msg)
-        finally:
-            if files:
-                [x.close() for x in files if not x.closed]
+            return self._finalize_message(msg)
 
     def crosspost_message(
         self, channel: Channel.TYPING, message: Message.TYPING
@@ -609,9 +671,7 @@ class APIClient:
         :return: :class:`~..Message`
         """
         msg = self.http.crosspost_message(int(channel), int(message))
-        if isinstance(msg, dict):
-            return Message.create(self, msg)
-        return wrap_to_async(Message, self, msg)
+        return self._finalize_message(msg)
 
     def create_reaction(
         self, channel: Channel.TYPING, message: Message.TYPING, emoji: Union[str, Emoji]
@@ -671,8 +731,8 @@ class APIClient:
         users = self.http.request_reactions(
             int(channel), int(message), from_emoji(emoji), int(after), limit
         )
-        if isinstance(users, list):
-            return [User.create(self, x) for x in users]
+        if type(users) is list:
+            return list(map(self._mk_user, users))
         return wrap_to_async(User, self, users)
 
     def delete_all_reactions(self, channel: Channel.TYPING, message: Message.TYPING):
@@ -699,6 +759,9 @@ class APIClient:
             int(channel), int(message), from_emoji(emoji)
         )
 
+    @_exclusive_params(
+        ("file", "files"), ("embed", "embeds"), ("component", "components")
+    )
     def edit_message(
         self,
         channel: Channel.TYPING,
@@ -712,7 +775,7 @@ class APIClient:
         allowed_mentions: Optional[Union[AllowedMentions, dict]] = EmptyObject,
         attachments: Optional[List[Union[Attachment, dict]]] = EmptyObject,
         component: Optional[Union[dict, Component]] = EmptyObject,
-        components: Optional[List[Union[dict, Component]]] = EmptyObject
+        components: Optional[List[Union[dict, Component]]] = EmptyObject,
     ) -> Message.RESPONSE:
         """
         Edits message.
@@ -739,77 +802,60 @@ class APIClient:
         :type components: Optional[List[Union[dict, Component]]]
         :return: :class:`~.Message`
         """
-        if files and file:
-            raise TypeError("you can't pass both file and files.")
         if file is None or files is None:
             files = None
-        else:
-            if file:
-                files = [file]
+        elif file:
+            files = [file]
+        with contextlib.ExitStack() as file_stack:
             if files:
-                for x in range(len(files)):
-                    sel = files[x]
-                    if isinstance(sel, str):
-                        files[x] = open(sel, "rb")
-        if embed and embeds:
-            raise TypeError("you can't pass both embed and embeds.")
-        if embed is None or embeds is None:
-            embeds = None
-        else:
-            if embed:
-                embeds = [embed]
-            if embeds:
-                embeds = [x if isinstance(x, dict) else x.to_dict() for x in embeds]
-        _att = []
-        if attachments:
-            for x in attachments:
-                if not isinstance(x, dict):
-                    x = x.to_dict()
-                _att.append(x)
-        if component and components:
-            raise TypeError("you can't pass both component and components.")
-        if component is None or components is None:
-            components = None
-        else:
-            if component:
-                components = [component]
-            if components:
-                components = [
-                    *map(
-                        lambda n: n if isinstance(n, dict) else n.to_dict(), components
-                    )
-                ]
-        params = {
-            "channel_id": int(channel),
-            "message_id": int(message),
-            "content": content,
-            "embeds": embeds,
-            "flags": EmptyObject,
-            "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
-            "attachments": _att,
-            "components": components,
-        }
-        if files:
-            params["files"] = files
-        try:
+                files = _normalize_files(files)
+                for x in files:
+                    file_stack.callback(x.close)
+            if embed is None or embeds is None:
+                embeds = None
+            else:
+                if embed:
+                    embeds = [embed]
+                if embeds:
+                    embeds = [x if isinstance(x, dict) else x.to_dict() for x in embeds]
+            _att = _normalize_attachments(attachments) if attachments else []
+            if component is None or components is None:
+                components = None
+            else:
+                if component:
+                    components = [component]
+                if components:
+                    components = [
+                        *map(
+                            lambda n: n if isinstance(n, dict) else n.to_dict(),
+                            components,
+                        )
+                    ]
+            params = {
+                "channel_id": int(channel),
+                "message_id": int(message),
+                "content": content,
+                "embeds": embeds,
+                "flags": EmptyObject,
+                "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
+                "attachments": _att,
+                "components": components,
+            }
+            if files:
+                params["files"] = files
             msg = (
                 self.http.edit_message(**params)
                 if not files
                 else self.http.edit_message_with_files(**params)
             )
-            if isinstance(msg, dict):
-                msg = Message.create(self, msg)
-            return wrap_to_async(Message, self, msg)
-        finally:
-            if files:
-                [x.close() for x in files]
+            return self._finalize_message(msg)
 
     def delete_message(
         self,
         channel: Channel.TYPING,
         message: Message.TYPING,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Deletes message.
@@ -824,7 +870,7 @@ class APIClient:
         self,
         channel: Channel.TYPING,
         *messages: Message.TYPING,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Bulk deletes messages.
@@ -834,7 +880,7 @@ class APIClient:
         :param Optional[str] reason: Reason of the action.
         """
         return self.http.bulk_delete_messages(
-            int(channel), list(map(int, messages)), reason=reason
+            int(channel), [str(int(x)) for x in messages], reason=reason
         )
 
     def edit_channel_permissions(
@@ -842,7 +888,7 @@ class APIClient:
         channel: Channel.TYPING,
         overwrite: Overwrite,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Edits channel permissions.
@@ -871,7 +917,7 @@ class APIClient:
         :return: :class:`~.Invite`
         """
         invites = self.http.request_channel_invites(int(channel))
-        if isinstance(invites, list):
+        if type(invites) is list:
             return [Invite(self, x) for x in invites]
         return wrap_to_async(Invite, self, invites, as_create=False)
 
@@ -886,7 +932,7 @@ class APIClient:
         target_type: Optional[Union[int, InviteTargetTypes]] = None,
         target_user: Optional[User.TYPING] = None,
         target_application: Optional[Application.TYPING] = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Invite.RESPONSE:
         """
         Creates channel invite.
@@ -916,7 +962,7 @@ class APIClient:
             else target_application,
             reason=reason,
         )
-        if isinstance(invite, dict):
+        if type(invite) is dict:
             return Invite(self, invite)
         return wrap_to_async(Invite, self, invite, as_create=False)
 
@@ -925,7 +971,7 @@ class APIClient:
         channel: Channel.TYPING,
         overwrite: Union[Overwrite.TYPING, User, Role],
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Deletes channel permission.
@@ -949,7 +995,7 @@ class APIClient:
         :return: :class:`~.FollowedChannel`
         """
         fc = self.http.follow_news_channel(int(channel), str(target_channel))
-        if isinstance(fc, dict):
+        if type(fc) is dict:
             return FollowedChannel(self, fc)
         return wrap_to_async(FollowedChannel, self, fc, as_create=False)
 
@@ -971,16 +1017,14 @@ class APIClient:
         :return: List[:class:`~.Message`]
         """
         msgs = self.http.request_pinned_messages(int(channel))
-        if isinstance(msgs, list):
-            return [Message.create(self, x) for x in msgs]
-        return wrap_to_async(Message, self, msgs)
+        return self._finalize_message(msgs)
 
     def pin_message(
         self,
         channel: Channel.TYPING,
         message: Message.TYPING,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Pins message to the channel.
@@ -996,7 +1040,7 @@ class APIClient:
         channel: Channel.TYPING,
         message: Message.TYPING,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Unpins message from the channel.
@@ -1041,7 +1085,7 @@ class APIClient:
         rate_limit_per_user: Optional[int] = EmptyObject,
         thread_type: Union[ChannelTypes, int] = None,
         invitable: bool = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Channel.RESPONSE:
         """
         Starts new thread.
@@ -1080,7 +1124,7 @@ class APIClient:
                 reason=reason,
             )
         )
-        if isinstance(channel, dict):
+        if type(channel) is dict:
             channel = Channel.create(self, channel)
         return wrap_to_async(Channel, self, channel)
 
@@ -1093,7 +1137,7 @@ class APIClient:
         rate_limit_per_user: Optional[int] = EmptyObject,
         applied_tags: Optional[List[Snowflake]] = None,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Channel.RESPONSE:
         channel = self.http.start_thread_in_forum_channel(
             int(channel),
@@ -1104,7 +1148,7 @@ class APIClient:
             applied_tags,
             reason=reason,
         )
-        if isinstance(channel, dict):
+        if type(channel) is dict:
             channel = Channel.create(self, channel)
         return wrap_to_async(Channel, self, channel)
 
@@ -1152,7 +1196,7 @@ class APIClient:
         :return: List[:class:`~.ThreadMember`]
         """
         members = self.http.list_thread_members(int(channel))
-        if isinstance(members, list):
+        if type(members) is list:
             return [ThreadMember(self, x) for x in members]
         return wrap_to_async(ThreadMember, self, members, as_create=False)
 
@@ -1161,7 +1205,7 @@ class APIClient:
         channel: Channel.TYPING,
         *,
         before: Optional[Union[str, datetime.datetime]] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
     ) -> ListThreadsResponse.RESPONSE:
         """
         Lists threads in channel that is archived and public.
@@ -1173,7 +1217,7 @@ class APIClient:
         :return: :class:`~.ListThreadsResponse`
         """
         resp = self.http.list_public_archived_threads(int(channel), before, limit)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return ListThreadsResponse(self, resp)
         return wrap_to_async(ListThreadsResponse, self, resp, as_create=False)
 
@@ -1182,7 +1226,7 @@ class APIClient:
         channel: Channel.TYPING,
         *,
         before: Optional[Union[str, datetime.datetime]] = None,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
     ) -> ListThreadsResponse.RESPONSE:
         """
         Lists threads in channel that is archived and private.
@@ -1194,7 +1238,7 @@ class APIClient:
         :return: :class:`~.ListThreadsResponse`
         """
         resp = self.http.list_private_archived_threads(int(channel), before, limit)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return ListThreadsResponse(self, resp)
         return wrap_to_async(ListThreadsResponse, self, resp, as_create=False)
 
@@ -1203,7 +1247,7 @@ class APIClient:
         channel: Channel.TYPING,
         *,
         before: Union[str, datetime.datetime] = None,
-        limit: int = None
+        limit: int = None,
     ) -> ListThreadsResponse.RESPONSE:
         """
         Lists threads in channel that is archived and private and joined.
@@ -1217,7 +1261,7 @@ class APIClient:
         resp = self.http.list_joined_private_archived_threads(
             int(channel), before, limit
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return ListThreadsResponse(self, resp)
         return wrap_to_async(ListThreadsResponse, self, resp, as_create=False)
 
@@ -1231,7 +1275,7 @@ class APIClient:
         :return: List[:class:`~.Emoji`]
         """
         resp = self.http.list_guild_emojis(int(guild))
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [Emoji(self, x) for x in resp]
         return wrap_to_async(Emoji, self, resp, as_create=False)
 
@@ -1246,7 +1290,7 @@ class APIClient:
         :return: :class:`~.Emoji`
         """
         resp = self.http.request_guild_emoji(int(guild), int(emoji))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Emoji(self, resp)
         return wrap_to_async(Emoji, self, resp, as_create=False)
 
@@ -1257,7 +1301,7 @@ class APIClient:
         name: str,
         image: str,
         roles: Optional[List[Role.TYPING]] = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Emoji.RESPONSE:
         """
         Creates emoji from guild.
@@ -1272,7 +1316,7 @@ class APIClient:
         resp = self.http.create_guild_emoji(
             int(guild), name, image, [str(int(x)) for x in roles or []], reason=reason
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Emoji(self, resp)
         return wrap_to_async(Emoji, self, resp, as_create=False)
 
@@ -1283,7 +1327,7 @@ class APIClient:
         *,
         name: Optional[str] = EmptyObject,
         roles: Optional[List[Role.TYPING]] = EmptyObject,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Emoji.RESPONSE:
         """
         Modifies emoji of the guild.
@@ -1302,7 +1346,7 @@ class APIClient:
             [str(int(x)) for x in roles] if roles else roles,
             reason=reason,
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Emoji(self, resp)
         return wrap_to_async(Emoji, self, resp, as_create=False)
 
@@ -1337,7 +1381,7 @@ class APIClient:
         afk_channel_id: Optional[Snowflake.TYPING] = None,
         afk_timeout: Optional[int] = None,
         system_channel_id: Optional[Snowflake.TYPING] = None,
-        system_channel_flags: Optional[Union[int, SystemChannelFlags]] = None
+        system_channel_flags: Optional[Union[int, SystemChannelFlags]] = None,
     ) -> Guild.RESPONSE:
         """
         Creates guild.
@@ -1384,7 +1428,7 @@ class APIClient:
         if system_channel_flags is not None:
             kwargs["system_channel_flags"] = int(system_channel_flags)
         resp = self.http.create_guild(**kwargs)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Guild.create(self, resp, ensure_cache_type="guild")
         return wrap_to_async(Guild, self, resp, ensure_cache_type="guild")
 
@@ -1399,7 +1443,7 @@ class APIClient:
         :return: :class:`~.Guild`
         """
         resp = self.http.request_guild(int(guild), with_counts)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Guild.create(self, resp, ensure_cache_type="guild")
         return wrap_to_async(Guild, self, resp, ensure_cache_type="guild")
 
@@ -1411,7 +1455,7 @@ class APIClient:
         :return: :class:`~.GuildPreview`
         """
         resp = self.http.request_guild_preview(int(guild))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildPreview(self, resp)
         return wrap_to_async(GuildPreview, self, resp)
 
@@ -1441,7 +1485,7 @@ class APIClient:
         preferred_locale: Optional[str] = EmptyObject,
         features: Optional[List[str]] = None,
         description: Optional[str] = EmptyObject,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Guild.RESPONSE:
         """
         Modifies guild.
@@ -1529,7 +1573,7 @@ class APIClient:
         if description is not EmptyObject:
             kwargs["description"] = description
         resp = self.http.modify_guild(int(guild), **kwargs, reason=reason)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Guild.create(self, resp, ensure_cache_type="guild")
         return wrap_to_async(Guild, self, resp, ensure_cache_type="guild")
 
@@ -1549,7 +1593,7 @@ class APIClient:
         :return: List[:class:`~.Channel`]
         """
         channels = self.http.request_guild_channels(int(guild))
-        if isinstance(channels, list):
+        if type(channels) is list:
             return [Channel.create(self, x) for x in channels]
         return wrap_to_async(Channel, self, channels)
 
@@ -1567,7 +1611,7 @@ class APIClient:
         permission_overwrites: Optional[Union[dict, Overwrite]] = None,
         parent: Optional[Channel.TYPING] = None,
         nsfw: Optional[bool] = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Channel.RESPONSE:
         """
         Creates channel in guild.
@@ -1614,7 +1658,7 @@ class APIClient:
         if nsfw is not None:
             kwargs["nsfw"] = nsfw
         resp = self.http.create_guild_channel(int(guild), **kwargs, reason=reason)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Channel.create(self, resp)
         return wrap_to_async(Channel, self, resp)
 
@@ -1641,7 +1685,7 @@ class APIClient:
         :return: :class:`~.ListThreadsResponse`
         """
         resp = self.http.list_active_threads(int(guild))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return ListThreadsResponse(self, resp)
         return wrap_to_async(ListThreadsResponse, self, resp, as_create=False)
 
@@ -1656,7 +1700,7 @@ class APIClient:
         :return: :class:`~.GuildMember`
         """
         resp = self.http.request_guild_member(int(guild), int(user))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildMember.create(self, resp, guild_id=int(guild))
         return wrap_to_async(GuildMember, self, resp, guild_id=int(guild))
 
@@ -1675,7 +1719,7 @@ class APIClient:
         :return: List[:class:`~.GuildMember`]
         """
         resp = self.http.list_guild_members(int(guild), limit, after)
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [GuildMember.create(self, x, guild_id=int(guild)) for x in resp]
         return wrap_to_async(GuildMember, self, resp, guild_id=int(guild))
 
@@ -1691,7 +1735,7 @@ class APIClient:
         :return: List[:class:`~.GuildMember`]
         """
         resp = self.http.search_guild_members(int(guild), query, limit)
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [GuildMember.create(self, x, guild_id=int(guild)) for x in resp]
         return wrap_to_async(GuildMember, self, resp, guild_id=int(guild))
 
@@ -1727,7 +1771,7 @@ class APIClient:
         if deaf is not None:
             kwargs["deaf"] = deaf
         resp = self.http.add_guild_member(int(guild), int(user), **kwargs)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildMember.create(self, resp, guild_id=int(guild))
         elif resp is None:
             return resp
@@ -1746,7 +1790,7 @@ class APIClient:
         communication_disabled_until: Optional[
             Union[datetime.datetime, str]
         ] = EmptyObject,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> GuildMember.RESPONSE:
         """
         Modifies guild member.
@@ -1783,7 +1827,7 @@ class APIClient:
         resp = self.http.modify_guild_member(
             int(guild), int(user), **kwargs, reason=reason
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildMember.create(self, resp, guild_id=int(guild))
         return wrap_to_async(GuildMember, self, resp, guild_id=int(guild))
 
@@ -1792,7 +1836,7 @@ class APIClient:
         guild: Guild.TYPING,
         nick: Optional[str] = EmptyObject,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Modifies nickname of the current client user.
@@ -1809,7 +1853,7 @@ class APIClient:
         user: User.TYPING,
         role: Role.TYPING,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Adds role to guild member.
@@ -1829,7 +1873,7 @@ class APIClient:
         user: User.TYPING,
         role: Role.TYPING,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Removes role of the guild member.
@@ -1865,7 +1909,7 @@ class APIClient:
         :return: List[:class:`~.Ban`]
         """
         resp = self.http.request_guild_bans(int(guild))
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [Ban(self, x) for x in resp]
         return wrap_to_async(Ban, self, resp, as_create=False)
 
@@ -1878,7 +1922,7 @@ class APIClient:
         :return: :class:`~.Ban`
         """
         resp = self.http.request_guild_ban(int(guild), int(user))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Ban(self, resp)
         return wrap_to_async(Ban, self, resp, as_create=False)
 
@@ -1888,7 +1932,7 @@ class APIClient:
         user: User.TYPING,
         *,
         delete_message_days: Optional[int] = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Creates guild ban.
@@ -1927,7 +1971,7 @@ class APIClient:
         :return: List[:class:`~.Role`]
         """
         resp = self.http.request_guild_roles(int(guild))
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [Role.create(self, x, guild_id=int(guild)) for x in resp]
         return wrap_to_async(Role, self, resp, guild_id=int(guild))
 
@@ -1940,7 +1984,7 @@ class APIClient:
         color: Optional[int] = None,
         hoist: Optional[bool] = None,
         mentionable: Optional[bool] = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Role.RESPONSE:
         """
         Creates role in the guild.
@@ -1967,7 +2011,7 @@ class APIClient:
         if mentionable is not None:
             kwargs["mentionable"] = mentionable
         resp = self.http.create_guild_role(int(guild), **kwargs, reason=reason)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Role.create(self, resp, guild_id=int(guild))
         return wrap_to_async(Role, self, resp, guild_id=int(guild))
 
@@ -1986,7 +2030,7 @@ class APIClient:
         resp = self.http.modify_guild_role_positions(
             int(guild), [*params], reason=reason
         )
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [Role.create(self, x, guild_id=int(guild)) for x in resp]
         return wrap_to_async(Role, self, resp, guild_id=int(guild))
 
@@ -2000,7 +2044,7 @@ class APIClient:
         color: Optional[int] = EmptyObject,
         hoist: Optional[bool] = EmptyObject,
         mentionable: Optional[bool] = EmptyObject,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Role.RESPONSE:
         """
         Modifies role of the guild.
@@ -2030,7 +2074,7 @@ class APIClient:
         resp = self.http.modify_guild_role(
             int(guild), int(role), **kwargs, reason=reason
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Role.create(self, resp, guild_id=int(guild))
         return wrap_to_async(Role, self, resp, guild_id=int(guild))
 
@@ -2051,7 +2095,7 @@ class APIClient:
         guild: Guild.TYPING,
         *,
         days: Optional[int] = None,
-        include_roles: Optional[List[Role.TYPING]] = None
+        include_roles: Optional[List[Role.TYPING]] = None,
     ) -> Union[int, Awaitable[int]]:
         """
         Requests guild prune count.
@@ -2064,7 +2108,7 @@ class APIClient:
         if include_roles is not None:
             include_roles = [*map(str, include_roles)]
         resp = self.http.request_guild_prune_count(int(guild), days, include_roles)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return resp["pruned"]
 
         async def wrap() -> int:
@@ -2080,7 +2124,7 @@ class APIClient:
         days: Optional[int] = None,
         compute_prune_count: Optional[bool] = None,
         include_roles: Optional[List[Role.TYPING]] = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Optional[Union[int, Awaitable[int]]]:
         """
         Begins guild prune.
@@ -2097,7 +2141,7 @@ class APIClient:
         resp = self.http.begin_guild_prune(
             int(guild), days, compute_prune_count, include_roles, reason=reason
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return resp["pruned"]
 
         async def wrap() -> int:
@@ -2116,7 +2160,7 @@ class APIClient:
         :return: List[:class:`~.VoiceRegion`]
         """
         resp = self.http.request_guild_voice_regions(int(guild))
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [VoiceRegion(x) for x in resp]
         return wrap_to_async(VoiceRegion, None, resp, as_create=False)
 
@@ -2128,7 +2172,7 @@ class APIClient:
         :return: List[:class:`~.Invite`]
         """
         resp = self.http.request_guild_invites(int(guild))
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [Invite(self, x) for x in resp]
         return wrap_to_async(Invite, self, resp, as_create=False)
 
@@ -2142,7 +2186,7 @@ class APIClient:
         :return: List[:class:`~.Integration`]
         """
         resp = self.http.request_guild_integrations(int(guild))
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [Integration(self, x) for x in resp]
         return wrap_to_async(Integration, self, resp, as_create=False)
 
@@ -2151,7 +2195,7 @@ class APIClient:
         guild: Guild.TYPING,
         integration: Integration.TYPING,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Deletes guild integration.
@@ -2174,7 +2218,7 @@ class APIClient:
         :return: :class:`~.GuildWidget`
         """
         resp = self.http.request_guild_widget_settings(int(guild))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildWidgetSettings(resp)
         return wrap_to_async(GuildWidgetSettings, None, resp, as_create=False)
 
@@ -2184,7 +2228,7 @@ class APIClient:
         *,
         enabled: Optional[bool] = None,
         channel: Optional[Channel.TYPING] = EmptyObject,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> GuildWidgetSettings.RESPONSE:
         """
         Modifies guild widget.
@@ -2198,7 +2242,7 @@ class APIClient:
         resp = self.http.modify_guild_widget(
             int(guild), enabled, channel, reason=reason
         )  # noqa
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildWidgetSettings(resp)
         return wrap_to_async(GuildWidgetSettings, None, resp, as_create=False)
 
@@ -2213,7 +2257,7 @@ class APIClient:
         from .base.model import AbstractObject
 
         resp = self.http.request_guild_widget(int(guild))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildWidget(self, resp)
         return wrap_to_async(GuildWidget, self, resp, as_create=False)
 
@@ -2229,7 +2273,7 @@ class APIClient:
         from .base.model import AbstractObject
 
         resp = self.http.request_guild_vanity_url(int(guild))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return AbstractObject(resp)
         return wrap_to_async(AbstractObject, None, resp, as_create=False)
 
@@ -2255,7 +2299,7 @@ class APIClient:
         :return: :class:`~.WelcomeScreen`
         """
         resp = self.http.request_guild_welcome_screen(int(guild))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return WelcomeScreen(resp)
         return wrap_to_async(WelcomeScreen, None, resp, as_create=False)
 
@@ -2268,7 +2312,7 @@ class APIClient:
             List[Union[WelcomeScreenChannel, dict]]
         ] = EmptyObject,
         description: Optional[str] = EmptyObject,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> WelcomeScreen.RESPONSE:
         """
         Modifies guild welcome screen.
@@ -2289,13 +2333,13 @@ class APIClient:
         resp = self.http.modify_guild_welcome_screen(
             int(guild), enabled, welcome_channels, description, reason=reason
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return WelcomeScreen(resp)
         return wrap_to_async(WelcomeScreen, None, resp, as_create=False)
 
     def request_guild_onboarding(self, guild: Guild.TYPING) -> Onboarding.RESPONSE:
         resp = self.http.request_guild_onboarding(int(guild))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Onboarding(self, resp)
         return wrap_to_async(Onboarding, self, resp, as_create=False)
 
@@ -2316,7 +2360,7 @@ class APIClient:
             int(mode),
             reason=reason,
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Onboarding(self, resp)
         return wrap_to_async(Onboarding, self, resp, as_create=False)
 
@@ -2327,7 +2371,7 @@ class APIClient:
         user: User.TYPING = "@me",
         *,
         suppress: Optional[bool] = None,
-        request_to_speak_timestamp: Optional[Union[datetime.datetime, str]] = None
+        request_to_speak_timestamp: Optional[Union[datetime.datetime, str]] = None,
     ):
         """
         Modifies user's voice state.
@@ -2362,7 +2406,7 @@ class APIClient:
         :return: List[:class:`~.GuildScheduledEvent`]
         """
         resp = self.http.list_scheduled_events_for_guild(int(guild), with_user_count)
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [GuildScheduledEvent(self, x) for x in resp]
         return wrap_to_async(GuildScheduledEvent, self, resp, as_create=False)
 
@@ -2381,7 +2425,7 @@ class APIClient:
         scheduled_start_time: Union[str, datetime.datetime],
         scheduled_end_time: Optional[Union[str, datetime.datetime]] = None,
         description: Optional[str] = None,
-        entity_type: Union[int, GuildScheduledEventEntityTypes]
+        entity_type: Union[int, GuildScheduledEventEntityTypes],
     ) -> GuildScheduledEvent.RESPONSE:
         """
         Creates guild scheduled event.
@@ -2427,7 +2471,7 @@ class APIClient:
         if description is not None:
             kwargs["description"] = description
         resp = self.http.create_guild_scheduled_event(int(guild), **kwargs)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildScheduledEvent(self, resp)
         return wrap_to_async(GuildScheduledEvent, self, resp, as_create=False)
 
@@ -2448,7 +2492,7 @@ class APIClient:
         resp = self.http.request_guild_scheduled_event(
             int(guild), int(guild_scheduled_event), with_user_count
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildScheduledEvent(self, resp)
         return wrap_to_async(GuildScheduledEvent, self, resp, as_create=False)
 
@@ -2467,7 +2511,7 @@ class APIClient:
         scheduled_end_time: Optional[Union[str, datetime.datetime]] = None,
         description: Optional[str] = None,
         entity_type: Optional[Union[int, GuildScheduledEventEntityTypes]] = None,
-        status: Optional[Union[int, GuildScheduledEventStatus]] = None
+        status: Optional[Union[int, GuildScheduledEventStatus]] = None,
     ) -> GuildScheduledEvent.RESPONSE:
         """
         Modifies guild scheduled event.
@@ -2525,7 +2569,7 @@ class APIClient:
         resp = self.http.modify_guild_scheduled_event(
             int(guild), int(guild_scheduled_event), **kwargs
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildScheduledEvent(self, resp)
         return wrap_to_async(GuildScheduledEvent, self, resp, as_create=False)
 
@@ -2570,7 +2614,7 @@ class APIClient:
             str(int(before)),
             str(int(after)),
         )
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [GuildScheduledEventUser(self, x) for x in resp]
         return wrap_to_async(GuildScheduledEventUser, self, resp, as_create=False)
 
@@ -2587,7 +2631,7 @@ class APIClient:
         :return: :class:`~.GuildTemplate`
         """
         resp = self.http.request_guild_template(str(template))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildTemplate(self, resp)
         return wrap_to_async(GuildTemplate, self, resp, as_create=False)
 
@@ -2604,7 +2648,7 @@ class APIClient:
         :return: :class:`~.Guild`
         """
         resp = self.http.create_guild_from_template(str(template), name, icon)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Guild.create(self, resp)
         return wrap_to_async(Guild, self, resp)
 
@@ -2618,7 +2662,7 @@ class APIClient:
         :return: List[:class:`~.GuildTemplate`]
         """
         resp = self.http.request_guild_templates(int(guild))
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [GuildTemplate(self, x) for x in resp]
         return wrap_to_async(GuildTemplate, self, resp, as_create=False)
 
@@ -2627,7 +2671,7 @@ class APIClient:
         guild: Guild.TYPING,
         name: str,
         *,
-        description: Optional[str] = EmptyObject
+        description: Optional[str] = EmptyObject,
     ) -> GuildTemplate.RESPONSE:
         """
         Creates template from guild.
@@ -2638,7 +2682,7 @@ class APIClient:
         :return: :class:`~.GuildTemplate`
         """
         resp = self.http.create_guild_template(int(guild), name, description)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildTemplate(self, resp)
         return wrap_to_async(GuildTemplate, self, resp, as_create=False)
 
@@ -2654,7 +2698,7 @@ class APIClient:
         :return: :class:`~.GuildTemplate`
         """
         resp = self.http.sync_guild_template(int(guild), str(template))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildTemplate(self, resp)
         return wrap_to_async(GuildTemplate, self, resp, as_create=False)
 
@@ -2678,7 +2722,7 @@ class APIClient:
         resp = self.http.modify_guild_template(
             int(guild), str(template), name, description
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildTemplate(self, resp)
         return wrap_to_async(GuildTemplate, self, resp, as_create=False)
 
@@ -2694,7 +2738,7 @@ class APIClient:
         :return: :class:`~.GuildTemplate`
         """
         resp = self.http.delete_guild_template(int(guild), str(template))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildTemplate(self, resp)
         return wrap_to_async(GuildTemplate, self, resp, as_create=False)
 
@@ -2705,7 +2749,7 @@ class APIClient:
         invite_code: Union[str, Invite],
         *,
         with_counts: Optional[bool] = None,
-        with_expiration: Optional[bool] = None
+        with_expiration: Optional[bool] = None,
     ) -> Invite.RESPONSE:
         """
         Requests invite.
@@ -2717,7 +2761,7 @@ class APIClient:
         :return: :class:`~.Invite`
         """
         resp = self.http.request_invite(str(invite_code), with_counts, with_expiration)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Invite(self, resp)
         return wrap_to_async(Invite, self, resp, as_create=False)
 
@@ -2733,7 +2777,7 @@ class APIClient:
         :return: :class:`~.Invite`
         """
         resp = self.http.delete_invite(str(invite_code), reason=reason)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Invite(self, resp)
         return wrap_to_async(Invite, self, resp, as_create=False)
 
@@ -2745,7 +2789,7 @@ class APIClient:
         topic: str,
         privacy_level: Optional[Union[int, PrivacyLevel]] = None,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> StageInstance.RESPONSE:
         """
         Creates stage instance.
@@ -2763,7 +2807,7 @@ class APIClient:
             int(privacy_level) if privacy_level is not None else privacy_level,
             reason=reason,
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return StageInstance.create(self, resp)
         return wrap_to_async(StageInstance, self, resp)
 
@@ -2775,7 +2819,7 @@ class APIClient:
         :return: :class:`~.StageInstance`
         """
         resp = self.http.request_stage_instance(int(channel))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return StageInstance.create(self, resp)
         return wrap_to_async(StageInstance, self, resp)
 
@@ -2785,7 +2829,7 @@ class APIClient:
         topic: Optional[str] = None,
         privacy_level: Optional[Union[int, PrivacyLevel]] = None,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> StageInstance.RESPONSE:
         """
         Modifies stage instance.
@@ -2803,7 +2847,7 @@ class APIClient:
             int(privacy_level) if privacy_level is not None else privacy_level,
             reason=reason,
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return StageInstance.create(self, resp)
         return wrap_to_async(StageInstance, self, resp)
 
@@ -2828,7 +2872,7 @@ class APIClient:
         :return: :class:`~.Sticker`
         """
         resp = self.http.request_sticker(int(sticker))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Sticker.create(self, resp)
         return wrap_to_async(Sticker, self, resp)
 
@@ -2841,7 +2885,7 @@ class APIClient:
         from .base.model import AbstractObject
 
         resp = self.http.list_nitro_sticker_packs()
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return AbstractObject(resp)
         return wrap_to_async(AbstractObject, None, resp, as_create=False)
 
@@ -2853,7 +2897,7 @@ class APIClient:
         :return: List[:class:`~.Sticker`]
         """
         resp = self.http.list_guild_stickers(int(guild))
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [Sticker.create(self, x) for x in resp]
         return wrap_to_async(Sticker, self, resp)
 
@@ -2868,7 +2912,7 @@ class APIClient:
         :return: :class:`~.Sticker`
         """
         resp = self.http.request_guild_sticker(int(guild), int(sticker))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Sticker.create(self, resp)
         return wrap_to_async(Sticker, self, resp)
 
@@ -2880,7 +2924,7 @@ class APIClient:
         description: str,
         tags: str,
         file: FILE_TYPE,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Sticker.RESPONSE:
         """
         Creates guild sticker.
@@ -2899,7 +2943,7 @@ class APIClient:
             resp = self.http.create_guild_sticker(
                 int(guild), name, description, tags, file, reason=reason
             )
-            if isinstance(resp, dict):
+            if type(resp) is dict:
                 return Sticker.create(self, resp)
             return wrap_to_async(Sticker, self, resp)
         finally:
@@ -2913,7 +2957,7 @@ class APIClient:
         name: Optional[str] = None,
         description: Optional[str] = EmptyObject,
         tags: Optional[str] = None,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ) -> Sticker.RESPONSE:
         """
         Modifies guild sticker.
@@ -2929,7 +2973,7 @@ class APIClient:
         resp = self.http.modify_guild_sticker(
             int(guild), int(sticker), name, description, tags, reason=reason
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Sticker.create(self, resp)
         return wrap_to_async(Sticker, self, resp)
 
@@ -2938,7 +2982,7 @@ class APIClient:
         guild: Guild.TYPING,
         sticker: Sticker.TYPING,
         *,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
     ):
         """
         Deletes guild sticker.
@@ -2961,7 +3005,7 @@ class APIClient:
         resp = self.http.request_user(
             int(user) if not isinstance(user, str) or user != "@me" else user
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return User.create(self, resp)
         return wrap_to_async(User, self, resp)
 
@@ -2981,7 +3025,7 @@ class APIClient:
             else avatar
         )
         resp = self.http.modify_current_user(username, avatar)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return User.create(self, resp)
         return wrap_to_async(User, self, resp)
 
@@ -2992,7 +3036,7 @@ class APIClient:
         :return: List[:class:`~.Guild`]
         """
         resp = self.http.request_current_user_guilds()
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [Guild.create(self, x) for x in resp]
         return wrap_to_async(Guild, self, resp)
 
@@ -3012,7 +3056,7 @@ class APIClient:
         :return: :class:`~.Channel`
         """
         resp = self.http.create_dm(str(int(recipient)))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Channel.create(self, resp)
         return wrap_to_async(Channel, self, resp)
 
@@ -3028,13 +3072,13 @@ class APIClient:
         """
         nicks = {str(int(k)): v for k, v in nicks.items()}
         resp = self.http.create_group_dm(access_tokens, nicks)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Channel.create(self, resp)
         return wrap_to_async(Channel, self, resp)
 
     def request_user_connections(self) -> Connection.RESPONSE_AS_LIST:
         resp = self.http.request_user_connections()
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [Connection(self, x) for x in resp]
         return wrap_to_async(Connection, self, resp)
 
@@ -3042,7 +3086,7 @@ class APIClient:
         self, application: Application.TYPING
     ) -> ApplicationRoleConnection.RESPONSE:
         resp = self.http.request_user_application_role_connections(int(application))
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return ApplicationRoleConnection(resp)
         return wrap_to_async(ApplicationRoleConnection, None, resp, as_create=False)
 
@@ -3056,7 +3100,7 @@ class APIClient:
         resp = self.http.update_user_application_role_connections(
             int(application), platform_name, platform_username, metadata
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return ApplicationRoleConnection(resp)
         return wrap_to_async(ApplicationRoleConnection, None, resp, as_create=False)
 
@@ -3069,7 +3113,7 @@ class APIClient:
         :return: List[:class:`~.VoiceRegion`]
         """
         resp = self.http.list_voice_regions()
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [VoiceRegion(x) for x in resp]
         return wrap_to_async(VoiceRegion, None, resp, as_create=False)
 
@@ -3080,7 +3124,7 @@ class APIClient:
         channel: Channel.TYPING,
         *,
         name: Optional[str] = None,
-        avatar: Optional[str] = None
+        avatar: Optional[str] = None,
     ) -> Webhook.RESPONSE:
         """
         Creates webhook.
@@ -3091,7 +3135,7 @@ class APIClient:
         :return: :class:`~.Webhook`
         """
         hook = self.http.create_webhook(int(channel), name, avatar)
-        if isinstance(hook, dict):
+        if type(hook) is dict:
             return Webhook(self, hook)
         return wrap_to_async(Webhook, self, hook, as_create=False)
 
@@ -3105,8 +3149,8 @@ class APIClient:
         :return: List[:class:`~.Webhook`]
         """
         hooks = self.http.request_channel_webhooks(int(channel))
-        if isinstance(hooks, list):
-            return [Webhook(self, x) for x in hooks]
+        if type(hooks) is list:
+            return list(map(self._mk_webhook, hooks))
         return wrap_to_async(Webhook, self, hooks, as_create=False)
 
     def request_guild_webhooks(self, guild: Guild.TYPING) -> Webhook.RESPONSE_AS_LIST:
@@ -3117,8 +3161,8 @@ class APIClient:
         :return: List[:class:`~.Webhook`]
         """
         hooks = self.http.request_guild_webhooks(int(guild))
-        if isinstance(hooks, list):
-            return [Webhook(self, x) for x in hooks]
+        if type(hooks) is list:
+            return list(map(self._mk_webhook, hooks))
         return wrap_to_async(Webhook, self, hooks, as_create=False)
 
     def request_webhook(
@@ -3138,7 +3182,7 @@ class APIClient:
             if not webhook_token
             else self.http.request_webhook_with_token(int(webhook), webhook_token)
         )
-        if isinstance(hook, dict):
+        if type(hook) is dict:
             return Webhook(self, hook)
         return wrap_to_async(Webhook, self, hook, as_create=False)
 
@@ -3149,7 +3193,7 @@ class APIClient:
         webhook_token: Optional[str] = None,
         name: Optional[str] = None,
         avatar: Optional[str] = None,
-        channel: Optional[Channel.TYPING] = None
+        channel: Optional[Channel.TYPING] = None,
     ) -> Webhook.RESPONSE:
         """
         Modifies webhook.
@@ -3173,7 +3217,7 @@ class APIClient:
                 int(webhook), webhook_token, name, avatar
             )
         )
-        if isinstance(hook, dict):
+        if type(hook) is dict:
             return Webhook(self, hook)
         return wrap_to_async(Webhook, self, hook, as_create=False)
 
@@ -3193,6 +3237,7 @@ class APIClient:
             else self.http.delete_webhook_with_token(int(webhook), webhook_token)
         )
 
+    @_exclusive_params(("file", "files"), ("embed", "embeds"))
     def execute_webhook(
         self,
         webhook: Webhook.TYPING,
@@ -3209,7 +3254,7 @@ class APIClient:
         embed: Optional[Union[Embed, dict]] = None,
         embeds: Optional[List[Union[Embed, dict]]] = None,
         allowed_mentions: Optional[Union[AllowedMentions, dict]] = None,
-        components: Optional[List[Union[dict, Component]]] = None
+        components: Optional[List[Union[dict, Component]]] = None,
     ) -> Message.RESPONSE:
         """
         Executes webhook.
@@ -3240,65 +3285,53 @@ class APIClient:
             )
         if thread and isinstance(thread, Channel) and not thread.is_thread_channel():
             raise TypeError("thread must be thread channel.")
-        if file and files:
-            raise TypeError("you can't pass both file and files.")
-        if embed and embeds:
-            raise TypeError("you can't pass both embed and embeds.")
         if file:
             files = [file]
-        if files:
-            for x in range(len(files)):
-                sel = files[x]
-                if isinstance(sel, str):
-                    files[x] = open(sel, "rb")
-        if embed:
-            embeds = [embed]
-        if embeds:
-            embeds = [x.to_dict() if not isinstance(x, dict) else x for x in embeds]
-        if components:
-            components = [
-                x.to_dict() if not isinstance(x, dict) else x for x in components
-            ]
-        params = {
-            "webhook_id": int(webhook),
-            "webhook_token": webhook_token
-            if not isinstance(webhook, Webhook)
-            else webhook.token,
-            "wait": wait,
-            "thread_id": str(int(thread)) if thread else thread,
-            "content": content,
-            "username": username,
-            "avatar_url": avatar_url,
-            "tts": tts,
-            "embeds": embeds,
-            "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
-            "components": components,
-        }
-        if files:
-            params["files"] = files
-        try:
+        with contextlib.ExitStack() as file_stack:
+            if files:
+                files = _normalize_files(files)
+                for x in files:
+                    file_stack.callback(x.close)
+            if embed:
+                embeds = [embed]
+            if embeds:
+                embeds = [x.to_dict() if not isinstance(x, dict) else x for x in embeds]
+            if components:
+                components = [
+                    x.to_dict() if not isinstance(x, dict) else x for x in components
+                ]
+            params = {
+                "webhook_id": int(webhook),
+                "webhook_token": webhook_token
+                if not isinstance(webhook, Webhook)
+                else webhook.token,
+                "wait": wait,
+                "thread_id": str(int(thread)) if thread else thread,
+                "content": content,
+                "username": username,
+                "avatar_url": avatar_url,
+                "tts": tts,
+                "embeds": embeds,
+                "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
+                "components": components,
+            }
+            if files:
+                params["files"] = files
             msg = (
                 self.http.execute_webhook(**params)
                 if not files
                 else self.http.execute_webhook_with_files(**params)
             )
-            if isinstance(msg, dict):
-                return Message.create(
-                    self, msg, webhook_token=webhook_token or webhook.token
-                )
-            return wrap_to_async(
-                Message, self, msg, webhook_token=webhook_token or webhook.token
+            return self._finalize_message(
+                msg, webhook_token=webhook_token or webhook.token
             )
-        finally:
-            if files:
-                [x.close() for x in files if not x.closed]
 
     def request_webhook_message(
         self,
         webhook: Webhook.TYPING,
         message: Message.TYPING,
         *,
-        webhook_token: Optional[str] = None
+        webhook_token: Optional[str] = None,
     ) -> Message.RESPONSE:
         """
         Requests webhook message.
@@ -3315,14 +3348,11 @@ class APIClient:
         msg = self.http.request_webhook_message(
             int(webhook), webhook_token or webhook.token, int(message)
         )
-        if isinstance(msg, dict):
-            return Message.create(
-                self, msg, webhook_token=webhook_token or webhook.token
-            )
-        return wrap_to_async(
-            Message, self, msg, webhook_token=webhook_token or webhook.token
-        )
+        return self._finalize_message(msg, webhook_token=webhook_token or webhook.token)
 
+    @_exclusive_params(
+        ("file", "files"), ("embed", "embeds"), ("component", "components")
+    )
     def edit_webhook_message(
         self,
         webhook: Webhook.TYPING,
@@ -3337,7 +3367,7 @@ class APIClient:
         allowed_mentions: Optional[Union[AllowedMentions, dict]] = EmptyObject,
         attachments: Optional[List[Union[Attachment, dict]]] = EmptyObject,
         component: Optional[Union[dict, Component]] = EmptyObject,
-        components: Optional[List[Union[dict, Component]]] = EmptyObject
+        components: Optional[List[Union[dict, Component]]] = EmptyObject,
     ) -> Message.RESPONSE:
         """
         Edits webhook message.
@@ -3368,76 +3398,57 @@ class APIClient:
             raise TypeError(
                 "you must pass webhook_token if webhook is not dico.Webhook object."
             )
-        if file and files:
-            raise TypeError("you can't pass both file and files.")
-        if embed and embeds:
-            raise TypeError("you can't pass both embed and embeds.")
-        if component and components:
-            raise TypeError("you can't pass both component and components.")
         if file is None or files is None:
             files = None
-        else:
-            if file:
-                files = [file]
+        elif file:
+            files = [file]
+        with contextlib.ExitStack() as file_stack:
             if files:
-                for x in range(len(files)):
-                    sel = files[x]
-                    if isinstance(sel, str):
-                        files[x] = open(sel, "rb")
-        if embed is None or embeds is None:
-            embeds = None
-        else:
-            if embed:
-                embeds = [embed]
-            if embeds:
-                embeds = [x if isinstance(x, dict) else x.to_dict() for x in embeds]
-        if component is None or components is None:
-            components = None
-        else:
-            if component:
-                components = [component]
-            if components:
-                components = [
-                    *map(
-                        lambda n: n if isinstance(n, dict) else n.to_dict(), components
-                    )
-                ]
-        _att = []
-        if attachments:
-            for x in attachments:
-                if not isinstance(x, dict):
-                    x = x.to_dict()
-                _att.append(x)
-        params = {
-            "webhook_id": int(webhook),
-            "webhook_token": webhook_token or webhook.token,
-            "message_id": int(message),
-            "content": content,
-            "embeds": embeds,
-            "files": files,
-            "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
-            "attachments": _att,
-            "components": components,
-        }
-        try:
+                files = _normalize_files(files)
+                for x in files:
+                    file_stack.callback(x.close)
+            if embed is None or embeds is None:
+                embeds = None
+            else:
+                if embed:
+                    embeds = [embed]
+                if embeds:
+                    embeds = [x if isinstance(x, dict) else x.to_dict() for x in embeds]
+            if component is None or components is None:
+                components = None
+            else:
+                if component:
+                    components = [component]
+                if components:
+                    components = [
+                        *map(
+                            lambda n: n if isinstance(n, dict) else n.to_dict(),
+                            components,
+                        )
+                    ]
+            _att = _normalize_attachments(attachments) if attachments else []
+            params = {
+                "webhook_id": int(webhook),
+                "webhook_token": webhook_token or webhook.token,
+                "message_id": int(message),
+                "content": content,
+                "embeds": embeds,
+                "files": files,
+                "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
+                "attachments": _att,
+                "components": components,
+            }
             msg = self.http.edit_webhook_message(**params)
-            if isinstance(msg, dict):
-                return Message.create(
-                    self, msg, webhook_token=webhook_token or webhook.token
-                )
-            return wrap_to_async(
-                Message, self, msg, webhook_token=webhook_token or webhook.token
+            return self._finalize_message(
+                msg, webhook_token=webhook_token or webhook.token
             )
-        finally:
-            if files:
-                [x.close() for x in files if not x.closed]
 
     def delete_webhook_message(
         self,
         webhook: Webhook.TYPING,
         message: Message.TYPING,
         *,
-        webhook_token: Optional[str] = None
+        webhook_token: Optional[str] = None,
     ):
         """
         Delete a message from a webhook.
@@ -3461,7 +3472,7 @@ class APIClient:
         self,
         guild: Optional[Guild.TYPING] = None,
         *,
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ) -> ApplicationCommand.RESPONSE_AS_LIST:
         """
         Request application commands.
@@ -3477,8 +3488,8 @@ class APIClient:
         app_commands = self.http.request_application_commands(
             int(application_id or self.application_id), int(guild) if guild else guild
         )
-        if isinstance(app_commands, list):
-            return [ApplicationCommand.create(x) for x in app_commands]
+        if type(app_commands) is list:
+            return list(map(ApplicationCommand.create, app_commands))
         return wrap_to_async(ApplicationCommand, None, app_commands)
 
     def create_application_command(
@@ -3490,7 +3501,7 @@ class APIClient:
         options: Optional[List[Union[ApplicationCommandOption, dict]]] = None,
         default_permission: Optional[bool] = None,
         command_type: Optional[Union[ApplicationCommandTypes, int]] = None,
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ) -> ApplicationCommand.RESPONSE:
         """
         Creates application command.
@@ -3523,7 +3534,7 @@ class APIClient:
             command_type,
             int(guild) if guild else guild,
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return ApplicationCommand.create(resp)
         return wrap_to_async(ApplicationCommand, None, resp)
 
@@ -3532,7 +3543,7 @@ class APIClient:
         command: ApplicationCommand.TYPING,
         *,
         guild: Optional[Guild.TYPING] = None,
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ) -> ApplicationCommand.RESPONSE:
         """
         Requests application command.
@@ -3552,7 +3563,7 @@ class APIClient:
         resp = self.http.request_application_command(
             int(application_id or self.application_id), command_id, int(guild)
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return ApplicationCommand.create(resp)
         return wrap_to_async(ApplicationCommand, None, resp)
 
@@ -3565,7 +3576,7 @@ class APIClient:
         options: Optional[List[Union[ApplicationCommandOption, dict]]] = None,
         default_permission: Optional[bool] = None,
         guild: Optional[Guild.TYPING] = None,
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ) -> ApplicationCommand.RESPONSE:
         """
         Edits application command.
@@ -3595,7 +3606,7 @@ class APIClient:
             default_permission,
             int(guild) if guild else guild,
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return ApplicationCommand.create(resp)
         return wrap_to_async(ApplicationCommand, None, resp)
 
@@ -3604,7 +3615,7 @@ class APIClient:
         command: ApplicationCommand.TYPING,
         *,
         guild: Optional[Guild.TYPING] = None,
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ):
         """
         Deletes application command.
@@ -3628,7 +3639,7 @@ class APIClient:
         self,
         *commands: Union[dict, ApplicationCommand],
         guild: Optional[Guild.TYPING] = None,
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ) -> ApplicationCommand.RESPONSE_AS_LIST:
         """
         Bulk overwrites application commands.
@@ -3649,8 +3660,8 @@ class APIClient:
             commands,
             int(guild) if guild else guild,
         )
-        if isinstance(app_commands, list):
-            return [ApplicationCommand.create(x) for x in app_commands]
+        if type(app_commands) is list:
+            return list(map(ApplicationCommand.create, app_commands))
         return wrap_to_async(ApplicationCommand, None, app_commands)
 
     def create_interaction_response(
@@ -3658,7 +3669,7 @@ class APIClient:
         interaction: Interaction.TYPING,
         interaction_response: Union[dict, InteractionResponse],
         *,
-        interaction_token: Optional[str] = None
+        interaction_token: Optional[str] = None,
     ):
         """
         Creates interaction response.
@@ -3689,7 +3700,7 @@ class APIClient:
         message: Message.TYPING = "@original",
         *,
         interaction_token: Optional[str] = None,
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ) -> Message.RESPONSE:
         """
         Requests interaction response.
@@ -3714,21 +3725,13 @@ class APIClient:
             int(message) if message != "@original" else message,
         )
         original_response = message == "@original"
-        if isinstance(msg, dict):
-            return Message.create(
-                self,
-                msg,
-                interaction_token=interaction_token or interaction.token,
-                original_response=original_response,
-            )
-        return wrap_to_async(
-            Message,
-            self,
+        return self._finalize_message(
             msg,
             interaction_token=interaction_token or interaction.token,
             original_response=original_response,
         )
 
+    @_exclusive_params(("file", "files"), ("embed", "embeds"))
     def create_followup_message(
         self,
         interaction: Optional[Interaction.TYPING] = None,
@@ -3745,7 +3748,7 @@ class APIClient:
         embeds: Optional[List[Union[Embed, dict]]] = None,
         allowed_mentions: Optional[Union[AllowedMentions, dict]] = None,
         components: Optional[List[Union[dict, Component]]] = None,
-        ephemeral: Optional[bool] = False
+        ephemeral: Optional[bool] = False,
     ) -> Message.RESPONSE:
         """
         Creates followup message.
@@ -3778,56 +3781,44 @@ class APIClient:
             raise TypeError(
                 "you must pass interaction_token if interaction is not dico.Interaction object."
             )
-        if file and files:
-            raise TypeError("you can't pass both file and files.")
-        if embed and embeds:
-            raise TypeError("you can't pass both embed and embeds.")
         if file:
             files = [file]
-        if files:
-            for x in range(len(files)):
-                sel = files[x]
-                if isinstance(sel, str):
-                    files[x] = open(sel, "rb")
-        if embed:
-            embeds = [embed]
-        if embeds:
-            embeds = [x.to_dict() if not isinstance(x, dict) else x for x in embeds]
-        if components:
-            components = [
-                x.to_dict() if not isinstance(x, dict) else x for x in components
-            ]
-        params = {
-            "application_id": application_id or self.application_id,
-            "interaction_token": interaction_token or interaction.token,
-            "content": content,
-            "username": username,
-            "avatar_url": avatar_url,
-            "tts": tts,
-            "embeds": embeds,
-            "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
-            "components": components,
-        }
-        if files:
-            params["files"] = files
-        if ephemeral:
-            params["flags"] = 64
-        try:
+        with contextlib.ExitStack() as file_stack:
+            if files:
+                files = _normalize_files(files)
+                for x in files:
+                    file_stack.callback(x.close)
+            if embed:
+                embeds = [embed]
+            if embeds:
+                embeds = [x.to_dict() if not isinstance(x, dict) else x for x in embeds]
+            if components:
+                components = [
+                    x.to_dict() if not isinstance(x, dict) else x for x in components
+                ]
+            params = {
+                "application_id": application_id or self.application_id,
+                "interaction_token": interaction_token or interaction.token,
+                "content": content,
+                "username": username,
+                "avatar_url": avatar_url,
+                "tts": tts,
+                "embeds": embeds,
+                "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
+                "components": components,
+            }
+            if files:
+                params["files"] = files
+            if ephemeral:
+                params["flags"] = 64
             msg = self.http.create_followup_message(**params)
-            if isinstance(msg, dict):
-                return Message.create(
-                    self, msg, interaction_token=interaction_token or interaction.token
-                )
-            return wrap_to_async(
-                Message,
-                self,
-                msg,
-                interaction_token=interaction_token or interaction.token,
+            return self._finalize_message(
+                msg, interaction_token=interaction_token or interaction.token
             )
-        finally:
-            if files:
-                [x.close() for x in files if not x.closed]
 
+    @_exclusive_params(
+        ("file", "files"), ("embed", "embeds"), ("component", "components")
+    )
     def edit_interaction_response(
         self,
         interaction: Optional[Interaction.TYPING] = None,
@@ -3843,7 +3834,7 @@ class APIClient:
         allowed_mentions: Optional[Union[AllowedMentions, dict]] = EmptyObject,
         attachments: Optional[List[Union[Attachment, dict]]] = EmptyObject,
         component: Optional[Union[dict, Component]] = EmptyObject,
-        components: Optional[List[Union[dict, Component]]] = EmptyObject
+        components: Optional[List[Union[dict, Component]]] = EmptyObject,
     ) -> Message.RESPONSE:
         """
         Edits interaction response.
@@ -3877,81 +3868,52 @@ class APIClient:
             raise TypeError(
                 "you must pass interaction_token if interaction is not dico.Interaction object."
             )
-        if file and files:
-            raise TypeError("you can't pass both file and files.")
-        if embed and embeds:
-            raise TypeError("you can't pass both embed and embeds.")
-        if component and components:
-            raise TypeError("you can't pass both component and components.")
         if file is None or files is None:
             files = None
-        else:
-            if file:
-                files = [file]
+        elif file:
+            files = [file]
+        with contextlib.ExitStack() as file_stack:
             if files:
-                for x in range(len(files)):
-                    sel = files[x]
-                    if isinstance(sel, str):
-                        files[x] = open(sel, "rb")
-        if embed is None or embeds is None:
-            embeds = None
-        else:
-            if embed:
-                embeds = [embed]
-            if embeds:
-                embeds = [x if isinstance(x, dict) else x.to_dict() for x in embeds]
-        if component is None or components is None:
-            components = None
-        else:
-            if component:
-                components = [component]
-            if components:
-                components = [
-                    *map(
-                        lambda n: n if isinstance(n, dict) else n.to_dict(), components
-                    )
-                ]
-        _att = []
-        if attachments:
-            for x in attachments:
-                if not isinstance(x, dict):
-                    x = x.to_dict()
-                _att.append(x)
-        params = {
-            "application_id": application_id or self.application_id,
-            "interaction_token": interaction_token or interaction.token,
-            "message_id": int(message) if message != "@original" else message,
-            "content": content,
-            "embeds": embeds,
-            "files": files,
-            "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
-            "attachments": _att,
-            "components": components,
-        }
-        try:
+                files = _normalize_files(files)
+                for x in files:
+                    file_stack.callback(x.close)
+            if embed is None or embeds is None:
+                embeds = None
+            else:
+                if embed:
+                    embeds = [embed]
+                if embeds:
+                    embeds = [x if isinstance(x, dict) else x.to_dict() for x in embeds]
+            if component is None or components is None:
+                components = None
+            else:
+                if component:
+                    components = [component]
+                if components:
+                    components = [
+                        *map(
+                            lambda n: n if isinstance(n, dict) else n.to_dict(),
+                            components,
+                        )
+                    ]
+            _att = _normalize_attachments(attachments) if attachments else []
+            params = {
+                "application_id": application_id or self.application_id,
+                "interaction_token": interaction_token or interaction.token,
+                "message_id": int(message) if message != "@original" else message,
+                "content": content,
+                "embeds": embeds,
+                "files": files,
+                "allowed_mentions": self.get_allowed_mentions(allowed_mentions),
+                "attachments": _att,
+                "components": components,
+            }
             msg = self.http.edit_interaction_response(**params)
-            if isinstance(msg, dict):
-                return Message.create(
-                    self,
-                    msg,
-                    interaction_token=interaction_token or interaction.token,
-                    original_response=message is None or message == "@original",
-                )
-            return wrap_to_async(
-                Message,
-                self,
+            return self._finalize_message(
                 msg,
                 interaction_token=interaction_token or interaction.token,
                 original_response=message is None or message == "@original",
             )
-        finally:
-            if files:
-                [x.close() for x in files if not x.closed]
-
-    @property
-    def edit_followup_message(self):
-        """Alias of :meth:`.edit_interaction_response`."""
-        return self.edit_interaction_response
 
     def delete_interaction_response(
         self,
@@ -3959,7 +3921,7 @@ class APIClient:
         message: Message.TYPING = "@original",
         *,
         interaction_token: Optional[str] = None,
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ):
         """
         Deletes interaction response.
@@ -4000,7 +3962,7 @@ class APIClient:
         resp = self.http.request_guild_application_command_permissions(
             int(application_id or self.application_id), int(guild)
         )
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [GuildApplicationCommandPermissions(x) for x in resp]
         return wrap_to_async(
             GuildApplicationCommandPermissions, None, resp, as_create=False
@@ -4011,7 +3973,7 @@ class APIClient:
         guild: Guild.TYPING,
         command: ApplicationCommand.TYPING,
         *,
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ) -> GuildApplicationCommandPermissions.RESPONSE:
         """
         Requests application command permissions.
@@ -4028,7 +3990,7 @@ class APIClient:
         resp = self.http.request_application_command_permissions(
             int(application_id or self.application_id), int(guild), int(command)
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildApplicationCommandPermissions(resp)
         return wrap_to_async(
             GuildApplicationCommandPermissions, None, resp, as_create=False
@@ -4039,7 +4001,7 @@ class APIClient:
         guild: Guild.TYPING,
         command: ApplicationCommand.TYPING,
         *permissions: Union[dict, ApplicationCommandPermissions],
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ) -> GuildApplicationCommandPermissions.RESPONSE:
         """
         Edits application command permissions.
@@ -4062,7 +4024,7 @@ class APIClient:
             int(command),
             permissions,
         )
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GuildApplicationCommandPermissions(resp)
         return wrap_to_async(
             GuildApplicationCommandPermissions, None, resp, as_create=False
@@ -4075,7 +4037,7 @@ class APIClient:
             ApplicationCommand.TYPING, List[Union[dict, ApplicationCommandPermissions]]
         ],
         *,
-        application_id: Optional[Snowflake.TYPING] = None
+        application_id: Optional[Snowflake.TYPING] = None,
     ) -> GuildApplicationCommandPermissions.RESPONSE_AS_LIST:
         """
         Batch edits application command permissions.
@@ -4099,7 +4061,7 @@ class APIClient:
         resp = self.http.batch_edit_application_command_permissions(
             int(application_id or self.application_id), int(guild), permissions_dicts
         )
-        if isinstance(resp, list):
+        if type(resp) is list:
             return [GuildApplicationCommandPermissions(x) for x in resp]
         return wrap_to_async(
             GuildApplicationCommandPermissions, None, resp, as_create=False
@@ -4114,7 +4076,7 @@ class APIClient:
         :return: :class:`~.Application`
         """
         resp = self.http.request_current_bot_application_information()
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return Application(self, resp)
         return wrap_to_async(Application, self, resp, as_create=False)
 
@@ -4130,12 +4092,88 @@ class APIClient:
         :return: :class:`~.GetGateway`
         """
         resp = self.http.request_gateway(bot)
-        if isinstance(resp, dict):
+        if type(resp) is dict:
             return GetGateway(resp)
         return wrap_to_async(GetGateway, None, resp, as_create=False)
 
     # Misc
 
+    def gather(self, *requests) -> Awaitable[list]:
+        """
+        Awaits multiple requests concurrently, costing only a single round-trip time.
+
+        Example:
+
+        .. code-block:: python
+
+            msg, _ = await api.gather(
+                api.create_message(channel, "hello"),
+                api.create_reaction(channel, message, "👍"),
+            )
+
+        .. note::
+            This is only available if the HTTP base is async. Per-bucket rate
+            limits are still respected in the HTTP layer.
+
+        :param requests: Request awaitables to run concurrently.
+        :return: List of the responses, in the order of the passed requests.
+        """
+        if not asyncio.iscoroutinefunction(self.http.request):
+            raise TypeError("gather is only available if the HTTP base is async.")
+        return asyncio.gather(*requests)
+
+    def submit(self, method_name: str, *args, **kwargs) -> "asyncio.Task":
+        """
+        Schedules a request without awaiting its response, returning the task immediately.
+
+        This is useful for fire-and-forget requests, i.e. adding a reaction
+        while the next message create is already in flight.
+
+        .. note::
+            This is only available if the HTTP base is async.
+
+        :param str method_name: Name of the APIClient method to run.
+        :param args: Args of the method.
+        :param kwargs: Keyword args of the method.
+        :return: :class:`asyncio.Task`
+        """
+        if not asyncio.iscoroutinefunction(self.http.request):
+            raise TypeError("submit is only available if the HTTP base is async.")
+        return self.http.loop.create_task(getattr(self, method_name)(*args, **kwargs))
+
+    def _reuse_or_create(
+        self, cls: Type[DiscordObjectBase], resp: dict, **kwargs
+    ) -> DiscordObjectBase:
+        """
+        Reuses existing wrapper instance for the response if one is still alive,
+        updating it in-place, otherwise creates and remembers a new one.
+
+        Only used when the client has no cache; with a cache, ``cls.create``
+        already reuses and refreshes the instance stored there, and keeping a
+        second copy here would let the two diverge.
+
+        :param cls: Model class of the wrapper.
+        :param resp: Response dict.
+        :return: Updated or newly created instance of ``cls``.
+        """
+        if self.has_cache:
+            return cls.create(self, resp, **kwargs)
+        maybe_exist = self._wrapper_cache.get(int(resp["id"]))
+        if type(maybe_exist) is cls:
+            maybe_exist.update(resp, **kwargs)
+            return maybe_exist
+        ret = cls.create(self, resp, **kwargs)
+        self._wrapper_cache[int(ret.id)] = ret
+        return ret
+
+    async def _async_reuse_or_create(
+        self, cls: Type[DiscordObjectBase], resp, **kwargs
+    ) -> DiscordObjectBase:
+        resp = await resp
+        if type(resp) is dict:
+            return self._reuse_or_create(cls, resp, **kwargs)
+        return resp
+
     def get_allowed_mentions(self, allowed_mentions):
         """
         Automatically converts allowed_mentions to dict.
@@ -4143,10 +4181,23 @@ class APIClient:
         :param allowed_mentions: Allowed mentions.
         :return: dict
         """
-        _all_men = allowed_mentions or self.default_allowed_mentions
-        if _all_men and not isinstance(_all_men, dict):
-            _all_men = _all_men.to_dict()
-        return _all_men
+        if not allowed_mentions:
+            return self._default_allowed_mentions_dict
+        if not isinstance(allowed_mentions, dict):
+            allowed_mentions = allowed_mentions.to_dict()
+        return allowed_mentions
+
+    @property
+    def default_allowed_mentions(self) -> Optional[AllowedMentions]:
+        """Default allowed mentions object of the API client."""
+        return self._default_allowed_mentions
+
+    @default_allowed_mentions.setter
+    def default_allowed_mentions(self, value: Optional[AllowedMentions]):
+        self._default_allowed_mentions = value
+        self._default_allowed_mentions_dict = (
+            value.to_dict() if value and not isinstance(value, dict) else value
+        )
 
     @property
     def get(self):
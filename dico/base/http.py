@@ -1,8 +1,21 @@
 import datetime
+import functools
 import io
+import json
 import typing
 from abc import ABC, abstractmethod
 
+try:
+    import orjson
+
+    def json_dumps(obj: typing.Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
 
 class __EmptyObject:
     """An empty object. Can be used as an alternative of ``None``."""
@@ -22,6 +35,41 @@ _R = typing.Optional[typing.Union[dict, list, str, bytes]]
 RESPONSE = typing.Union[_R, typing.Awaitable[_R]]
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_body_builder(keys: typing.Tuple[str, ...]) -> typing.Callable[..., dict]:
+    """
+    Compiles a specialized body builder for given combination of present keys.
+
+    Since message-related endpoints are called repeatedly with the same set of
+    params, each combination gets its own compiled function which builds the
+    body dict in a single expression instead of re-running every per-key branch.
+
+    :param keys: Tuple of the body keys that are present.
+    :return: Compiled builder function.
+    """
+    source = "def build({}):\n    return {{{}}}".format(
+        ", ".join(keys), ", ".join(f'"{x}": {x}' for x in keys)
+    )
+    namespace = {}
+    exec(compile(source, "<body_builder>", "exec"), {}, namespace)
+    return namespace["build"]
+
+
+def _build_body(
+    keys: typing.Tuple[str, ...], values: tuple, empty: typing.Any = None
+) -> dict:
+    """
+    Builds request body dict from given keys and values, skipping ``empty`` values.
+
+    :param keys: Tuple of all possible body keys.
+    :param values: Values matching ``keys`` by position.
+    :param empty: Sentinel meaning the param was not passed. Defaults to ``None``.
+    :return: Body as dict.
+    """
+    present = tuple(k for k, v in zip(keys, values) if v is not empty)
+    return _compile_body_builder(present)(*(v for v in values if v is not empty))
+
+
 class HTTPRequestBase(ABC):
     """
     This abstract class includes all API request methods.
@@ -396,23 +444,28 @@ class HTTPRequestBase(ABC):
         """
         if not (content or embeds or sticker_ids):
             raise ValueError("either content or embed or sticker_ids must be passed.")
-        body = {}
-        if content is not None:
-            body["content"] = content
-        if embeds is not None:
-            body["embeds"] = embeds
-        if nonce is not None:
-            body["nonce"] = nonce
-        if tts is not None:
-            body["tts"] = tts
-        if allowed_mentions is not None:
-            body["allowed_mentions"] = allowed_mentions
-        if message_reference is not None:
-            body["message_reference"] = message_reference
-        if components is not None:
-            body["components"] = components
-        if sticker_ids is not None:
-            body["sticker_ids"] = sticker_ids
+        body = _build_body(
+            (
+                "content",
+                "embeds",
+                "nonce",
+                "tts",
+                "allowed_mentions",
+                "message_reference",
+                "components",
+                "sticker_ids",
+            ),
+            (
+                content,
+                embeds,
+                nonce,
+                tts,
+                allowed_mentions,
+                message_reference,
+                components,
+                sticker_ids,
+            ),
+        )
         return self.request(
             f"/channels/{channel_id}/messages", "POST", body, is_json=True
         )
@@ -560,19 +613,18 @@ class HTTPRequestBase(ABC):
         :param components: Components of the message.
         :return: Message object dict.
         """
-        body = {}
-        if content is not EmptyObject:
-            body["content"] = content
-        if embeds is not EmptyObject:
-            body["embeds"] = embeds
-        if flags is not EmptyObject:
-            body["flags"] = flags
-        if allowed_mentions is not EmptyObject:
-            body["allowed_mentions"] = allowed_mentions
-        if attachments is not EmptyObject:
-            body["attachments"] = attachments
-        if components is not EmptyObject:
-            body["components"] = components
+        body = _build_body(
+            (
+                "content",
+                "embeds",
+                "flags",
+                "allowed_mentions",
+                "attachments",
+                "components",
+            ),
+            (content, embeds, flags, allowed_mentions, attachments, components),
+            empty=EmptyObject,
+        )
         return self.request(
             f"/channels/{channel_id}/messages/{message_id}", "PATCH", body, is_json=True
         )
@@ -2699,23 +2751,28 @@ class HTTPRequestBase(ABC):
         """
         if not (content or embeds):
             raise ValueError("either content or embeds must be passed.")
-        body = {}
-        if content is not None:
-            body["content"] = content
-        if username is not None:
-            body["username"] = username
-        if avatar_url is not None:
-            body["avatar_url"] = avatar_url
-        if tts is not None:
-            body["tts"] = tts
-        if embeds is not None:
-            body["embeds"] = embeds
-        if allowed_mentions is not None:
-            body["allowed_mentions"] = allowed_mentions
-        if components is not None:
-            body["components"] = components
-        if flags is not None:
-            body["flags"] = flags
+        body = _build_body(
+            (
+                "content",
+                "username",
+                "avatar_url",
+                "tts",
+                "embeds",
+                "allowed_mentions",
+                "components",
+                "flags",
+            ),
+            (
+                content,
+                username,
+                avatar_url,
+                tts,
+                embeds,
+                allowed_mentions,
+                components,
+                flags,
+            ),
+        )
         params = {}
         if wait is not None:
             params["wait"] = "true" if wait else "false"
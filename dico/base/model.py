@@ -1,4 +1,5 @@
 import copy
+import types
 import typing
 
 from ..model.snowflake import Snowflake
@@ -108,10 +109,24 @@ class AbstractObject(dict):
 
 
 class FlagBase:
+    values: typing.Dict[str, int] = {}
+    _all_value: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.values = types.MappingProxyType(
+            {
+                x: getattr(cls, x)
+                for x in dir(cls)
+                if not x.startswith("_") and isinstance(getattr(cls, x), int)
+            }
+        )
+        all_value = 0
+        for x in cls.values.values():
+            all_value |= x
+        cls._all_value = all_value
+
     def __init__(self, *args: str, **kwargs: bool):
-        self.values: typing.Dict[str, int] = {
-            x: getattr(self, x) for x in dir(self) if isinstance(getattr(self, x), int)
-        }
         self.value: int = 0
         for x in args:
             if x.upper() not in self.values:
@@ -144,7 +159,7 @@ class FlagBase:
     def __setattr__(self, key, value):
         orig = key
         key = key.upper()
-        if orig in ["value", "values"] or key not in self.values.keys():
+        if orig in ("value", "values") or key not in self.values:
             return super().__setattr__(orig, value)
         if not isinstance(value, bool):
             raise TypeError(f"only type `bool` is supported.")
@@ -1,6 +1,5 @@
 import asyncio
 import io
-import json
 import logging
 import typing
 from urllib.parse import quote
@@ -8,7 +7,14 @@ from urllib.parse import quote
 import aiohttp
 
 from .. import __version__, exception
-from ..base.http import _R, EmptyObject, HTTPRequestBase
+from ..base.http import (
+    _R,
+    EmptyObject,
+    HTTPRequestBase,
+    _build_body,
+    json_dumps,
+    json_loads,
+)
 from .ratelimit import RatelimitHandler
 
 ASYNC_RESPONSE = typing.Awaitable[_R]
@@ -28,7 +34,9 @@ class AsyncHTTPRequest(HTTPRequestBase):
 
     :ivar token: Application token of the client.
     :ivar logger: Logger instance of the client.
-    :ivar session: ClientSession of the client.
+    :ivar session: ClientSession of the client. A single session is created per
+        client and reused for every request, so connections and TLS handshakes
+        are shared instead of being re-established per call.
     :ivar default_retry: Maximum retry count of the client.
     :ivar ratelimits: :class:`.ratelimit.RatelimitHandler` of the client.
     """
@@ -44,7 +52,10 @@ class AsyncHTTPRequest(HTTPRequestBase):
         self.logger: logging.Logger = logging.getLogger("dico.http")
         self.loop: asyncio.AbstractEventLoop = loop or asyncio.get_event_loop()
         self.session: aiohttp.ClientSession = session or aiohttp.ClientSession(
-            loop=self.loop
+            loop=self.loop,
+            connector=aiohttp.TCPConnector(
+                loop=self.loop, limit=100, keepalive_timeout=75
+            ),
         )
         self.default_retry: int = default_retry
         self._close_on_del: bool = False
@@ -145,14 +156,14 @@ class AsyncHTTPRequest(HTTPRequestBase):
             if meth not in ["GET"] and body is not None:
                 if is_json:
                     headers["Content-Type"] = "application/json"
-                    body = json.dumps(body)
+                    body = json_dumps(body)
                 kwargs["data"] = body
             if reason_header is not None:
                 headers["X-Audit-Log-Reason"] = quote(reason_header, encoding="UTF-8")
             async with self.session.request(
                 meth, self.BASE_URL + route, headers=headers, **kwargs
             ) as resp:
-                self.logger.debug(f"{route}: {meth} request - {resp.status}")
+                self.logger.debug("%s: %s request - %s", route, meth, resp.status)
                 bucket = resp.headers.get("X-RateLimit-Bucket")
                 reset_after = resp.headers.get("X-RateLimit-Reset-After")
                 reset_at = resp.headers.get("X-RateLimit-Reset")
@@ -162,7 +173,7 @@ class AsyncHTTPRequest(HTTPRequestBase):
                 )
                 maybe_json = (
                     await (
-                        resp.json()
+                        resp.json(loads=json_loads)
                         if resp.headers.get("Content-Type") == "application/json"
                         else resp.text()
                     )
@@ -226,7 +237,7 @@ class AsyncHTTPRequest(HTTPRequestBase):
         if attachments:
             payload_json["attachments"] = attachments
         form.add_field(
-            "payload_json", json.dumps(payload_json), content_type="application/json"
+            "payload_json", json_dumps(payload_json), content_type="application/json"
         )
         if files is not None:
             for x in range(len(files)):
@@ -250,22 +261,21 @@ class AsyncHTTPRequest(HTTPRequestBase):
         attachments: typing.List[dict] = EmptyObject,
         components: typing.List[dict] = EmptyObject,
     ) -> ASYNC_RESPONSE:
-        payload_json = {}
+        payload_json = _build_body(
+            (
+                "content",
+                "embeds",
+                "flags",
+                "allowed_mentions",
+                "attachments",
+                "components",
+            ),
+            (content, embeds, flags, allowed_mentions, attachments, components),
+            empty=EmptyObject,
+        )
         form = aiohttp.FormData()
-        if content is not EmptyObject:
-            payload_json["content"] = content
-        if embeds is not EmptyObject:
-            payload_json["embeds"] = embeds
-        if flags is not EmptyObject:
-            payload_json["flags"] = flags
-        if allowed_mentions is not EmptyObject:
-            payload_json["allowed_mentions"] = allowed_mentions
-        if attachments is not EmptyObject:
-            payload_json["attachments"] = attachments
-        if components is not EmptyObject:
-            payload_json["components"] = components
         form.add_field(
-            "payload_json", json.dumps(payload_json), content_type="application/json"
+            "payload_json", json_dumps(payload_json), content_type="application/json"
         )
         if files is not EmptyObject:
             for x in range(len(files)):
@@ -318,33 +328,38 @@ class AsyncHTTPRequest(HTTPRequestBase):
     ) -> ASYNC_RESPONSE:
         if not (content or embeds or files):
             raise ValueError("either content or embeds or files must be passed.")
-        payload_json = {}
+        payload_json = _build_body(
+            (
+                "content",
+                "username",
+                "avatar_url",
+                "tts",
+                "embeds",
+                "allowed_mentions",
+                "components",
+                "attachments",
+                "flags",
+            ),
+            (
+                content,
+                username,
+                avatar_url,
+                tts,
+                embeds,
+                allowed_mentions,
+                components,
+                attachments,
+                flags,
+            ),
+        )
         form = aiohttp.FormData()
-        if content is not None:
-            payload_json["content"] = content
-        if username is not None:
-            payload_json["username"] = username
-        if avatar_url is not None:
-            payload_json["avatar_url"] = avatar_url
-        if tts is not None:
-            payload_json["tts"] = tts
-        if embeds is not None:
-            payload_json["embeds"] = embeds
-        if allowed_mentions is not None:
-            payload_json["allowed_mentions"] = allowed_mentions
-        if components is not None:
-            payload_json["components"] = components
-        if attachments is not None:
-            payload_json["attachments"] = attachments
-        if flags is not None:
-            payload_json["flags"] = flags
         params = {}
         if wait is not None:
             params["wait"] = "true" if wait else "false"
         if thread_id is not None:
             params["thread_id"] = thread_id
         form.add_field(
-            "payload_json", json.dumps(payload_json), content_type="application/json"
+            "payload_json", json_dumps(payload_json), content_type="application/json"
         )
         if files is not None:
             for x in range(len(files)):
@@ -370,20 +385,14 @@ class AsyncHTTPRequest(HTTPRequestBase):
         attachments: typing.List[dict] = EmptyObject,
         components: typing.List[dict] = EmptyObject,
     ) -> ASYNC_RESPONSE:
-        payload_json = {}
+        payload_json = _build_body(
+            ("content", "embeds", "allowed_mentions", "attachments", "components"),
+            (content, embeds, allowed_mentions, attachments, components),
+            empty=EmptyObject,
+        )
         form = aiohttp.FormData()
-        if content is not EmptyObject:
-            payload_json["content"] = content
-        if embeds is not EmptyObject:
-            payload_json["embeds"] = embeds
-        if allowed_mentions is not EmptyObject:
-            payload_json["allowed_mentions"] = allowed_mentions
-        if attachments is not EmptyObject:
-            payload_json["attachments"] = attachments
-        if components is not EmptyObject:
-            payload_json["components"] = components
         form.add_field(
-            "payload_json", json.dumps(payload_json), content_type="application/json"
+            "payload_json", json_dumps(payload_json), content_type="application/json"
         )
         if files is not EmptyObject:
             for x in range(len(files)):
@@ -1,5 +1,4 @@
 import io
-import json
 import logging
 import time
 import typing
@@ -8,7 +7,14 @@ from urllib.parse import quote
 import requests
 
 from .. import __version__, exception
-from ..base.http import _R, EmptyObject, HTTPRequestBase
+from ..base.http import (
+    _R,
+    EmptyObject,
+    HTTPRequestBase,
+    _build_body,
+    json_dumps,
+    json_loads,
+)
 
 RESPONSE = _R
 
@@ -37,7 +43,7 @@ class HTTPRequest(HTTPRequestBase):
         if meth not in ["GET"] and body is not None:
             if is_json:
                 headers["Content-Type"] = "application/json"
-                body = json.dumps(body)
+                body = json_dumps(body)
             kwargs["data"] = body
         if reason_header is not None:
             headers["X-Audit-Log-Reason"] = quote(reason_header, encoding="UTF-8")
@@ -50,7 +56,7 @@ class HTTPRequest(HTTPRequestBase):
             )
             resp = (
                 (
-                    response.json()
+                    json_loads(response.content)
                     if response.headers.get("Content-Type") == "application/json"
                     else response.text
                 )
@@ -58,7 +64,7 @@ class HTTPRequest(HTTPRequestBase):
                 else None
             )
             code = response.status_code
-            self.logger.debug(f"{route}: {meth} request - {code}")
+            self.logger.debug("%s: %s request - %s", route, meth, code)
             if 200 <= code < 300:
                 return resp
             elif code == 400:
@@ -117,7 +123,7 @@ class HTTPRequest(HTTPRequestBase):
             payload_json["sticker_ids"] = sticker_ids
         if attachments:
             payload_json["attachments"] = attachments
-        _files = {"payload_json": (None, json.dumps(payload_json), "application/json")}
+        _files = {"payload_json": (None, json_dumps(payload_json), "application/json")}
         if files is not None:
             for x in range(len(files)):
                 name = f"file{x if len(files) > 1 else ''}"
@@ -138,20 +144,19 @@ class HTTPRequest(HTTPRequestBase):
         attachments: typing.List[dict] = EmptyObject,
         components: typing.List[dict] = EmptyObject,
     ) -> RESPONSE:
-        payload_json = {}
-        if content is not EmptyObject:
-            payload_json["content"] = content
-        if embeds is not EmptyObject:
-            payload_json["embeds"] = embeds
-        if flags is not EmptyObject:
-            payload_json["flags"] = flags
-        if allowed_mentions is not EmptyObject:
-            payload_json["allowed_mentions"] = allowed_mentions
-        if attachments is not EmptyObject:
-            payload_json["attachments"] = attachments
-        if components is not EmptyObject:
-            payload_json["components"] = components
-        _files = {"payload_json": (None, json.dumps(payload_json), "application/json")}
+        payload_json = _build_body(
+            (
+                "content",
+                "embeds",
+                "flags",
+                "allowed_mentions",
+                "attachments",
+                "components",
+            ),
+            (content, embeds, flags, allowed_mentions, attachments, components),
+            empty=EmptyObject,
+        )
+        _files = {"payload_json": (None, json_dumps(payload_json), "application/json")}
         if files is not EmptyObject:
             for x in range(len(files)):
                 name = f"file{x if len(files) > 1 else ''}"
@@ -198,31 +203,36 @@ class HTTPRequest(HTTPRequestBase):
         attachments: typing.List[dict] = None,
         flags: int = None,
     ) -> RESPONSE:
-        payload_json = {}
-        if content is not None:
-            payload_json["content"] = content
-        if username is not None:
-            payload_json["username"] = username
-        if avatar_url is not None:
-            payload_json["avatar_url"] = avatar_url
-        if tts is not None:
-            payload_json["tts"] = tts
-        if embeds is not None:
-            payload_json["embeds"] = embeds
-        if allowed_mentions is not None:
-            payload_json["allowed_mentions"] = allowed_mentions
-        if components is not None:
-            payload_json["components"] = components
-        if attachments is not None:
-            payload_json["attachments"] = attachments
-        if flags is not None:
-            payload_json["flags"] = flags
+        payload_json = _build_body(
+            (
+                "content",
+                "username",
+                "avatar_url",
+                "tts",
+                "embeds",
+                "allowed_mentions",
+                "components",
+                "attachments",
+                "flags",
+            ),
+            (
+                content,
+                username,
+                avatar_url,
+                tts,
+                embeds,
+                allowed_mentions,
+                components,
+                attachments,
+                flags,
+            ),
+        )
         params = {}
         if wait is not None:
             params["wait"] = "true" if wait else "false"
         if thread_id is not None:
             params["thread_id"] = thread_id
-        _files = {"payload_json": (None, json.dumps(payload_json), "application/json")}
+        _files = {"payload_json": (None, json_dumps(payload_json), "application/json")}
         if files is not None:
             for x in range(len(files)):
                 name = f"file{x if len(files) > 1 else ''}"
@@ -248,18 +258,12 @@ class HTTPRequest(HTTPRequestBase):
         attachments: typing.List[dict] = EmptyObject,
         components: typing.List[dict] = EmptyObject,
     ) -> RESPONSE:
-        payload_json = {}
-        if content is not EmptyObject:
-            payload_json["content"] = content
-        if embeds is not EmptyObject:
-            payload_json["embeds"] = embeds
-        if allowed_mentions is not EmptyObject:
-            payload_json["allowed_mentions"] = allowed_mentions
-        if attachments is not EmptyObject:
-            payload_json["attachments"] = attachments
-        if components is not EmptyObject:
-            payload_json["components"] = components
-        _files = {"payload_json": (None, json.dumps(payload_json), "application/json")}
+        payload_json = _build_body(
+            ("content", "embeds", "allowed_mentions", "attachments", "components"),
+            (content, embeds, allowed_mentions, attachments, components),
+            empty=EmptyObject,
+        )
+        _files = {"payload_json": (None, json_dumps(payload_json), "application/json")}
         if files is not None:
             for x in range(len(files)):
                 name = f"file{x if len(files) > 1 else ''}"
@@ -7,6 +7,9 @@ from .snowflake import Snowflake
 
 
 class GetGateway:
+    __slots__ = ("url", "shards", "session_start_limit")
+    _FIELDS = __slots__
+
     def __init__(self, resp: dict):
         self.url: str = resp["url"]
         self.shards: typing.Optional[int] = resp.get("shards", 0)
@@ -15,14 +18,13 @@ class GetGateway:
         ] = SessionStartLimit.optional(resp.get("session_start_limit"))
 
     def to_dict(self) -> dict:
-        return {
-            "url": self.url,
-            "shards": self.shards,
-            "session_start_limit": self.session_start_limit,
-        }
+        return {k: getattr(self, k) for k in self._FIELDS}
 
 
 class SessionStartLimit:
+    __slots__ = ("total", "remaining", "reset_after", "max_concurrency")
+    _FIELDS = __slots__
+
     def __init__(self, resp: dict):
         self.total = resp["total"]
         self.remaining = resp["remaining"]
@@ -35,12 +37,7 @@ class SessionStartLimit:
             return cls(resp)
 
     def to_dict(self):
-        return {
-            "total": self.total,
-            "remaining": self.remaining,
-            "reset_after": self.reset_after,
-            "max_concurrency": self.max_concurrency,
-        }
+        return {k: getattr(self, k) for k in self._FIELDS}
 
 
 class Intents(FlagBase):
@@ -64,7 +61,7 @@ class Intents(FlagBase):
 
     @classmethod
     def full(cls):
-        return cls(*[x for x in dir(cls) if isinstance(getattr(cls, x), int)])
+        return cls.from_value(cls._all_value)
 
     @classmethod
     def no_privileged(cls):
@@ -96,6 +93,9 @@ class Intents(FlagBase):
 
 
 class GatewayResponse:
+    __slots__ = ("raw", "op", "d", "s", "t")
+    _FIELDS = ("op", "d", "s", "t")  # raw is not part of the payload itself.
+
     def __init__(self, resp: dict):
         self.raw = resp
         self.op = resp["op"]
@@ -104,7 +104,7 @@ class GatewayResponse:
         self.t = resp.get("t")
 
     def to_dict(self):
-        return {"op": self.op, "d": self.d, "s": self.s, "t": self.t}
+        return {k: getattr(self, k) for k in self._FIELDS}
 
 
 class Activity:
@@ -356,19 +356,20 @@ class Opcodes:
     HELLO = 10
     HEARTBEAT_ACK = 11
 
-    @staticmethod
-    def as_string(code: int) -> str:
-        opcodes = {
-            0: "Dispatch",
-            1: "Heartbeat",
-            2: "Identify",
-            3: "Presence Update",
-            4: "Voice State Update",
-            6: "Resume",
-            7: "Reconnect",
-            8: "Request Guild Members",
-            9: "Invalid Session",
-            10: "Hello",
-            11: "Heartbeat ACK",
-        }
-        return opcodes.get(code)
+    _OPCODE_NAMES = {
+        0: "Dispatch",
+        1: "Heartbeat",
+        2: "Identify",
+        3: "Presence Update",
+        4: "Voice State Update",
+        6: "Resume",
+        7: "Reconnect",
+        8: "Request Guild Members",
+        9: "Invalid Session",
+        10: "Hello",
+        11: "Heartbeat ACK",
+    }
+
+    @classmethod
+    def as_string(cls, code: int) -> str:
+        return cls._OPCODE_NAMES.get(code)
@@ -7,6 +7,7 @@ class Snowflake:
 
     def __init__(self, snowflake: typing.Union[int, str]):
         self.__snowflake = int(snowflake)
+        self.__snowflake_str = str(self.__snowflake)
 
     @property
     def timestamp(self) -> datetime.datetime:
@@ -31,11 +32,13 @@ class Snowflake:
         return self
 
     def __str__(self) -> str:
-        return str(self.__snowflake)
+        return self.__snowflake_str
 
     def __int__(self) -> int:
         return self.__snowflake
 
+    __index__ = __int__
+
     def __eq__(self, other):
         return self.__snowflake == int(other)
 
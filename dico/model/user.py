@@ -42,16 +42,20 @@ class User(DiscordObjectBase):
         # self.voice_state: typing.Optional["VoiceState"] = self.raw.get("voice_state")  # Filled later.
         self.dm_channel_id: typing.Optional[Snowflake] = None
 
-    def __str__(self) -> str:
-        return (
+        # Immutable until the next update(), which re-runs __init__.
+        self._mention: str = f"<@{self.id}>"
+        self._str: str = (
             self.username
             if self.discriminator == "0"
             else f"{self.username}#{self.discriminator}"
         )
 
+    def __str__(self) -> str:
+        return self._str
+
     @property
     def mention(self) -> str:
-        return f"<@{self.id}>"
+        return self._mention
 
     def avatar_url(
         self, *, extension: str = "webp", size: int = 1024
@@ -98,22 +98,23 @@ class VoiceOpcodes:
     RESUMED = 9
     CLIENT_DISCONNECT = 13
 
-    @staticmethod
-    def as_string(code: int) -> str:
-        opcodes = {
-            0: "Identify",
-            1: "Select Protocol",
-            2: "Ready",
-            3: "Heartbeat",
-            4: "Session Description",
-            5: "Speaking",
-            6: "Heartbeat ACK",
-            7: "Resume",
-            8: "Hello",
-            9: "Resumed",
-            13: "Client Disconnect",
-        }
-        return opcodes.get(code)
+    _OPCODE_NAMES = {
+        0: "Identify",
+        1: "Select Protocol",
+        2: "Ready",
+        3: "Heartbeat",
+        4: "Session Description",
+        5: "Speaking",
+        6: "Heartbeat ACK",
+        7: "Resume",
+        8: "Hello",
+        9: "Resumed",
+        13: "Client Disconnect",
+    }
+
+    @classmethod
+    def as_string(cls, code: int) -> str:
+        return cls._OPCODE_NAMES.get(code)
 
 
 class SpeakingFlags:
@@ -1,4 +1,5 @@
 import base64
+import functools
 import inspect
 import io
 import pathlib
@@ -85,14 +86,19 @@ def format_discord_error(resp: dict) -> str:
     return resp["message"] + ((" - " + " | ".join(msgs)) if msgs else "")
 
 
+@functools.lru_cache(maxsize=256)
+def _from_emoji_str(emoji: str) -> str:
+    if emoji.startswith("<") and emoji.endswith(">"):
+        emoji = emoji.lstrip("<").rstrip(">")
+    return emoji
+
+
 def from_emoji(emoji: typing.Union["Emoji", str]) -> str:
     from .model.emoji import Emoji  # Prevent circular import.
 
     if isinstance(emoji, Emoji):
-        emoji = emoji.name if not emoji.id else f"{emoji.name}:{emoji.id}"
-    elif emoji.startswith("<") and emoji.endswith(">"):
-        emoji = emoji.lstrip("<").rstrip(">")
-    return emoji
+        return emoji.name if not emoji.id else f"{emoji.name}:{emoji.id}"
+    return _from_emoji_str(emoji)
 
 
 async def wrap_to_async(
@@ -103,10 +109,10 @@ async def wrap_to_async(
     **kwargs,
 ) -> typing.Any:
     resp = await resp
-    if isinstance(resp, dict):
+    if type(resp) is dict:
         args = (client, resp) if client is not None else (resp,)
         return cls.create(*args, **kwargs) if as_create else cls(*args, **kwargs)
-    elif isinstance(resp, list):
+    elif type(resp) is list:
         ret = []
         for x in resp:
             args = (client, x) if client is not None else (x,)
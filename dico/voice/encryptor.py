@@ -23,6 +23,6 @@ class Encryptor:
             raise ValueError("Encryptor mode not available")
         return getattr(self, mode)
 
-    def xsalsa20_poly1305_suffix(self, header: bytearray, data: bytes):
+    def xsalsa20_poly1305_suffix(self, header: bytes, data: bytes):
         nonce = utils.random(secret.SecretBox.NONCE_SIZE)
         return header + self.box.encrypt(data, nonce).ciphertext + nonce
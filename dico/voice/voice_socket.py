@@ -9,6 +9,8 @@ if TYPE_CHECKING:
 
 
 class VoiceSocket:
+    RTP_HEADER = struct.Struct(">BBHII")
+
     def __init__(self, parent: "VoiceWebsocket", sock):
         self.sock: socket.socket = sock
         self.parent = parent
@@ -32,24 +34,21 @@ class VoiceSocket:
         return cls(parent, sock)
 
     def generate_packet(self, data: bytes):
-        header = bytearray(12)
-        header[0] = 0x80
-        header[1] = 0x78
-        struct.pack_into(">H", header, 2, self.seq)  # 2 3
-        struct.pack_into(">I", header, 4, self.timestamp)  # 4 5 6 7
-        struct.pack_into(">I", header, 8, self.parent.ssrc)  # 8 9 10 11
-        return self.parent.encryptor.get_encryptor(self.parent.mode)(header, data)
+        parent = self.parent
+        header = self.RTP_HEADER.pack(0x80, 0x78, self.seq, self.timestamp, parent.ssrc)
+        return parent.encryptor.get_encryptor(parent.mode)(header, data)
 
     def send(self, data: bytes, encode_opus: bool = True):
+        parent = self.parent
         self.seq += 1
         if self.seq > 0xFFFF:
             self.seq = 0
         self.timestamp += SAMPLES_PER_FRAME
         if self.timestamp > 0xFFFFFFFF:
             self.timestamp = 0
-        data = self.parent.encoder.encode(data) if encode_opus else data
+        data = parent.encoder.encode(data) if encode_opus else data
         packet = self.generate_packet(data)
-        self.sock.sendto(packet, (self.parent.ip, self.parent.port))
+        self.sock.sendto(packet, (parent.ip, parent.port))
 
     def close(self):
         self.sock.close()
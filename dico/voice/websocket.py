@@ -1,10 +1,12 @@
 import asyncio
+import functools
 import logging
 import time
 from typing import TYPE_CHECKING, List, Optional, Union
 
 import aiohttp
 
+from ..base.http import json_dumps, json_loads
 from ..model import GatewayResponse, SpeakingFlags, VoiceOpcodes
 from ..ws.websocket import Ignore, WSClosing
 from .encryptor import Encryptor
@@ -18,8 +20,48 @@ if TYPE_CHECKING:
 
 class VoiceWebsocket:
     AVAILABLE_MODES = Encryptor.AVAILABLE
+    _AVAILABLE_SET = frozenset(Encryptor.AVAILABLE)
+    _HEARTBEAT_PREFIX = f'{{"op": {VoiceOpcodes.HEARTBEAT}, "d": '
     WS_KWARGS = {"autoclose": False, "autoping": False, "timeout": 60}
 
+    __slots__ = (
+        "client",
+        "ws",
+        "guild_id",
+        "endpoint",
+        "token",
+        "session_id",
+        "logger",
+        "ssrc",
+        "ip",
+        "port",
+        "modes",
+        "heartbeat_interval",
+        "_heartbeat_interval_s",
+        "_reconnecting",
+        "_fresh_reconnecting",
+        "last_heartbeat_ack",
+        "last_heartbeat_send",
+        "_heartbeat_task",
+        "ping",
+        "mode",
+        "sock",
+        "secret_key",
+        "encryptor",
+        "encoder",
+        "self_ip",
+        "self_port",
+        "_identify_str",
+        "_resume_str",
+        "_select_protocol_str",
+        "_speaking_payload",
+        "_op_handlers",
+        "_ws_connect",
+        "_VoiceWebsocket__keep_running",
+        "_VoiceWebsocket__ready",
+        "_VoiceWebsocket__new_server_set",
+    )
+
     def __init__(
         self,
         ws: aiohttp.ClientWebSocketResponse,
@@ -42,6 +84,7 @@ class VoiceWebsocket:
         self.port: Optional[int] = None
         self.modes: Optional[List[str]] = None
         self.heartbeat_interval: Optional[int] = None
+        self._heartbeat_interval_s: Optional[float] = None
         self._reconnecting: bool = False
         self._fresh_reconnecting: bool = False
         self.last_heartbeat_ack: float = 0
@@ -50,16 +93,34 @@ class VoiceWebsocket:
         self.ping: float = 0.0
         self.mode: Optional[str] = None
         self.sock: Optional[VoiceSocket] = None
-        self.secret_key: Optional[list] = None
+        self.secret_key: Optional[bytes] = None
         self.encryptor: Optional[Encryptor] = None
         self.encoder: OpusEncoder = OpusEncoder()
         self.self_ip: Optional[str] = None
         self.self_port: Optional[int] = None
+        self._identify_str: Optional[str] = None
+        self._resume_str: Optional[str] = None
+        self._select_protocol_str: Optional[str] = None
+        self._speaking_payload: dict = {
+            "op": VoiceOpcodes.SPEAKING,
+            "d": {"speaking": 0, "delay": 0, "ssrc": None},
+        }
         self.__ready: asyncio.Future = asyncio.Future()
         self.__new_server_set = asyncio.Future()
+        self._op_handlers = {
+            VoiceOpcodes.READY: self._on_ready,
+            VoiceOpcodes.HELLO: self._on_hello,
+            VoiceOpcodes.HEARTBEAT_ACK: self._on_heartbeat_ack,
+            VoiceOpcodes.SESSION_DESCRIPTION: self._on_session_description,
+            VoiceOpcodes.RESUMED: self._on_resumed,
+        }
+        # Endpoint stays a call-time argument since it may change on reconnect.
+        self._ws_connect = functools.partial(
+            client.http.session.ws_connect, **self.WS_KWARGS
+        )
 
     def get_mode(self) -> str:
-        return [x for x in self.modes if x in self.AVAILABLE_MODES][0]
+        return next(x for x in self.modes if x in self._AVAILABLE_SET)
 
     async def close(self, code: int = 1000, reconnect: bool = False):
         await self.cancel_heartbeat()
@@ -101,16 +162,14 @@ class VoiceWebsocket:
                     break
                 await self.process(resp)
             if self._reconnecting or self._fresh_reconnecting:
-                self.ws = await self.client.http.session.ws_connect(
-                    self.endpoint, **self.WS_KWARGS
-                )
+                self.ws = await self._ws_connect(self.endpoint)
             else:
                 self.__keep_running = False
 
     async def receive(self, resp: aiohttp.WSMessage) -> GatewayResponse:
-        self.logger.debug(f"Voice raw receive {resp.type}: {resp.data}")
+        self.logger.debug("Voice raw receive %s: %s", resp.type, resp.data)
         if resp.type == aiohttp.WSMsgType.TEXT:
-            return GatewayResponse(resp.json())
+            return GatewayResponse(json_loads(resp.data))
         elif resp.type == aiohttp.WSMsgType.CONTINUATION:
             raise Ignore
         elif resp.type in (
@@ -121,29 +180,38 @@ class VoiceWebsocket:
             raise WSClosing(resp.data or self.ws.close_code)
 
     async def process(self, resp: GatewayResponse):
-        if resp.op == VoiceOpcodes.READY:
-            self.ssrc = resp.d["ssrc"]
-            self.ip = resp.d["ip"]
-            self.port = resp.d["port"]
-            self.modes = resp.d["modes"]
-            self.mode = self.get_mode()
-            self.sock = await VoiceSocket.connect(self)
-            await self.select_protocol()
-        elif resp.op == VoiceOpcodes.HELLO:
-            self.heartbeat_interval = resp.d["heartbeat_interval"]
-            self._heartbeat_task = self.client.loop.create_task(self.run_heartbeat())
-        elif resp.op == VoiceOpcodes.HEARTBEAT_ACK:
-            if int(self.last_heartbeat_send * 1000) != resp.d:
-                self.last_heartbeat_ack = -1  # heartbeat sync failed
-            else:
-                self.last_heartbeat_ack = time.time()
-            self.ping = self.last_heartbeat_ack - (resp.d / 1000)
-        elif resp.op == VoiceOpcodes.SESSION_DESCRIPTION:
-            self.secret_key = resp.d["secret_key"]
-            self.encryptor = Encryptor(self.secret_key)
-            self.__ready.set_result(True)
-        elif resp.op == VoiceOpcodes.RESUMED:
-            self.__ready.set_result(True)
+        handler = self._op_handlers.get(resp.op)
+        if handler is not None:
+            await handler(resp.d)
+
+    async def _on_ready(self, d: dict):
+        self.ssrc = d["ssrc"]
+        self.ip = d["ip"]
+        self.port = d["port"]
+        self.modes = d["modes"]
+        self.mode = self.get_mode()
+        self.sock = await VoiceSocket.connect(self)
+        await self.select_protocol()
+
+    async def _on_hello(self, d: dict):
+        self.heartbeat_interval = d["heartbeat_interval"]
+        self._heartbeat_interval_s = self.heartbeat_interval / 1000
+        self._heartbeat_task = self.client.loop.create_task(self.run_heartbeat())
+
+    async def _on_heartbeat_ack(self, d):
+        if int(self.last_heartbeat_send * 1000) != d:
+            self.last_heartbeat_ack = -1  # heartbeat sync failed
+        else:
+            self.last_heartbeat_ack = time.monotonic()
+        self.ping = self.last_heartbeat_ack - (d / 1000)
+
+    async def _on_session_description(self, d: dict):
+        self.secret_key = bytes(d["secret_key"])
+        self.encryptor = Encryptor(self.secret_key)
+        self.__ready.set_result(True)
+
+    async def _on_resumed(self, d: dict):
+        self.__ready.set_result(True)
 
     async def reconnect(self, fresh: bool = False):
         if self._reconnecting or self._fresh_reconnecting:
@@ -162,6 +230,8 @@ class VoiceWebsocket:
         self.endpoint = f"wss://{payload.endpoint}?v=4"
         self.token = payload.token
         self.guild_id = payload.guild_id
+        self._identify_str = None
+        self._resume_str = None
         if not self.__new_server_set.done():
             self.__new_server_set.set_result(True)
 
@@ -176,80 +246,87 @@ class VoiceWebsocket:
             await self.close(code=code)
 
     async def identify(self):
-        payload = {
-            "op": VoiceOpcodes.IDENTIFY,
-            "d": {
-                "server_id": str(self.guild_id),
-                "user_id": str(self.client.user.id),
-                "session_id": self.session_id,
-                "token": self.token,
-            },
-        }
-        await self.ws.send_json(payload)
+        if self._identify_str is None:
+            self._identify_str = json_dumps(
+                {
+                    "op": VoiceOpcodes.IDENTIFY,
+                    "d": {
+                        "server_id": str(self.guild_id),
+                        "user_id": str(self.client.user.id),
+                        "session_id": self.session_id,
+                        "token": self.token,
+                    },
+                }
+            )
+        await self.ws.send_str(self._identify_str)
 
     async def resume(self):
-        payload = {
-            "op": VoiceOpcodes.RESUME,
-            "d": {
-                "server_id": str(self.guild_id),
-                "session_id": self.session_id,
-                "token": self.token,
-            },
-        }
-        await self.ws.send_json(payload)
+        if self._resume_str is None:
+            self._resume_str = json_dumps(
+                {
+                    "op": VoiceOpcodes.RESUME,
+                    "d": {
+                        "server_id": str(self.guild_id),
+                        "session_id": self.session_id,
+                        "token": self.token,
+                    },
+                }
+            )
+        await self.ws.send_str(self._resume_str)
         self._reconnecting = False
 
     async def select_protocol(self):
-        payload = {
-            "op": VoiceOpcodes.SELECT_PROTOCOL,
-            "d": {
-                "protocol": "udp",
-                "data": {
-                    "address": self.self_ip,
-                    "port": self.self_port,
-                    "mode": self.mode,
-                },
-            },
-        }
-        await self.ws.send_json(payload)
+        self.logger.debug("Selecting protocol with mode %s.", self.mode)
+        if self._select_protocol_str is None:
+            self._select_protocol_str = json_dumps(
+                {
+                    "op": VoiceOpcodes.SELECT_PROTOCOL,
+                    "d": {
+                        "protocol": "udp",
+                        "data": {
+                            "address": self.self_ip,
+                            "port": self.self_port,
+                            "mode": self.mode,
+                        },
+                    },
+                }
+            )
+        await self.ws.send_str(self._select_protocol_str)
 
     async def speaking(
         self,
         speaking_flag: Union[SpeakingFlags, int] = SpeakingFlags.MICROPHONE,
         is_speaking: bool = True,
     ):
-        payload = {
-            "op": VoiceOpcodes.SPEAKING,
-            "d": {
-                "speaking": speaking_flag if is_speaking else 0,
-                "delay": 0,
-                "ssrc": self.ssrc,
-            },
-        }
-        await self.ws.send_json(payload)
+        d = self._speaking_payload["d"]
+        d["speaking"] = speaking_flag if is_speaking else 0
+        d["ssrc"] = self.ssrc
+        await self.ws.send_json(self._speaking_payload, dumps=json_dumps)
 
     async def run_heartbeat(self):
+        monotonic = time.monotonic
+        sleep = asyncio.sleep
+        prefix = self._HEARTBEAT_PREFIX
+        send_str = self.ws.send_str
+        interval_s = self._heartbeat_interval_s
         try:
-            while self:
-                if self._reconnecting or self._fresh_reconnecting:
-                    break  # Just making sure
+            while self.__keep_running and not (
+                self._reconnecting or self._fresh_reconnecting
+            ):
                 if (
                     not self.last_heartbeat_send
                     <= self.last_heartbeat_ack
-                    <= time.time()
+                    <= monotonic()
                 ):
                     if self._reconnecting or self._fresh_reconnecting:
                         break
                     self.logger.warning("Heartbeat timeout, reconnecting...")
                     self.loop.create_task(self.reconnect())
                     break
-                self.last_heartbeat_send = time.time()
-                data = {
-                    "op": VoiceOpcodes.HEARTBEAT,
-                    "d": int(self.last_heartbeat_send * 1000),
-                }
-                await self.ws.send_json(data)
-                await asyncio.sleep(self.heartbeat_interval / 1000)
+                self.last_heartbeat_send = monotonic()
+                nonce = int(self.last_heartbeat_send * 1000)
+                await send_str(prefix + str(nonce) + "}")
+                await sleep(interval_s)
         except asyncio.CancelledError:
             return
 
@@ -267,7 +344,8 @@ class VoiceWebsocket:
     def set_self_ip(self, self_ip, self_port):
         self.self_ip = self_ip
         self.self_port = self_port
-        self.logger.debug(f"IP Discovery done, IP: {self_ip} Port: {self_port}")
+        self._select_protocol_str = None
+        self.logger.debug("IP Discovery done, IP: %s Port: %s", self_ip, self_port)
 
     async def wait_ready(self):
         if not self.__ready.done():
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import logging
 import time
 import typing
@@ -7,6 +6,7 @@ import zlib
 
 import aiohttp
 
+from ..base.http import json_loads
 from ..handler import EventHandler
 from ..http.async_http import AsyncHTTPRequest
 from ..model import gateway
@@ -18,6 +18,7 @@ class WebSocketClient:
     RECONNECT_CODES = [1000, 1001, 1006, 4000, 4001, 4002, 4003, 4005, 4007, 4009]
     INPUT_WARN = [4001, 4002, 4003, 4005]
     WS_KWARGS = {"autoclose": False, "autoping": False, "timeout": 60}
+    _HEARTBEAT_PREFIX = f'{{"op": {gateway.Opcodes.HEARTBEAT}, "d": '
 
     def __init__(
         self,
@@ -45,6 +46,7 @@ class WebSocketClient:
         self._reconnecting: bool = False
         self._fresh_reconnecting: bool = False
         self.heartbeat_interval: int = 0
+        self._heartbeat_interval_s: float = 0.0
         self.seq: typing.Optional[int] = None
         self.last_heartbeat_ack: float = 0
         self.last_heartbeat_send: float = 0
@@ -87,7 +89,7 @@ class WebSocketClient:
                 except Ignore:
                     continue
                 except WSClosing as ex:
-                    self.logger.warning(f"Websocket is closing with code: {ex.code}")
+                    self.logger.warning("Websocket is closing with code: %s", ex.code)
                     self.intended_shutdown = True
                     if (
                         ex.code in self.RECONNECT_CODES
@@ -129,8 +131,11 @@ class WebSocketClient:
                         "Sorry for the inconvenience."
                     )
                 self.logger.debug(
-                    f"Received `{gateway.Opcodes.as_string(resp.op)}` payload"
-                    f"{f' with event name `{resp.t}`' if resp.op == gateway.Opcodes.DISPATCH else ''}."
+                    "Received `%s` payload%s.",
+                    gateway.Opcodes.as_string(resp.op),
+                    f" with event name `{resp.t}`"
+                    if resp.op == gateway.Opcodes.DISPATCH
+                    else "",
                 )
                 if resp.s:
                     self.seq = resp.s
@@ -185,9 +190,9 @@ class WebSocketClient:
 
     async def receive(self, resp: aiohttp.WSMessage) -> gateway.GatewayResponse:
         # resp = await self.ws.receive()
-        self.logger.debug(f"Raw receive {resp.type}: {resp.data}")
+        self.logger.debug("Raw receive %s: %s", resp.type, resp.data)
         if resp.type == aiohttp.WSMsgType.TEXT:
-            return self.to_gateway_response(resp.json())
+            return self.to_gateway_response(json_loads(resp.data))
         elif resp.type == aiohttp.WSMsgType.BINARY:
             msg = resp.data
             self.buffer.extend(msg)
@@ -195,7 +200,7 @@ class WebSocketClient:
                 raise Ignore
             msg = self.inflator.decompress(self.buffer)
             self.buffer = bytearray()
-            return self.to_gateway_response(json.loads(msg.decode("UTF-8")))
+            return self.to_gateway_response(json_loads(msg))
         elif resp.type == aiohttp.WSMsgType.CONTINUATION:
             raise Ignore
         elif resp.type in (
@@ -217,7 +222,8 @@ class WebSocketClient:
 
         elif resp.op == gateway.Opcodes.HELLO:
             self.heartbeat_interval = resp.d["heartbeat_interval"]
-            self.ratelimit.reload_heartbeat(self.heartbeat_interval / 1000)
+            self._heartbeat_interval_s = self.heartbeat_interval / 1000
+            self.ratelimit.reload_heartbeat(self._heartbeat_interval_s)
             self._heartbeat_task = self.http.loop.create_task(self.run_heartbeat())
             if self._reconnecting:
                 await self.resume()
@@ -227,7 +233,7 @@ class WebSocketClient:
                 self._fresh_reconnecting = False
 
         elif resp.op == gateway.Opcodes.HEARTBEAT_ACK:
-            self.last_heartbeat_ack = time.time()
+            self.last_heartbeat_ack = time.monotonic()
             self.ping = self.last_heartbeat_ack - self._ping_start
 
         elif resp.op == gateway.Opcodes.INVALID_SESSION:
@@ -275,6 +281,11 @@ class WebSocketClient:
         self._reconnecting = False
 
     async def run_heartbeat(self):
+        monotonic = time.monotonic
+        sleep = asyncio.sleep
+        prefix = self._HEARTBEAT_PREFIX
+        send_str = self.ws.send_str
+        interval_s = self._heartbeat_interval_s
         try:
             while not self._closed:
                 if self._reconnecting or self._fresh_reconnecting:
@@ -282,18 +293,18 @@ class WebSocketClient:
                 if (
                     not self.last_heartbeat_send
                     <= self.last_heartbeat_ack
-                    <= time.time()
+                    <= monotonic()
                 ):
                     if self._reconnecting or self._fresh_reconnecting:
                         break
                     self.logger.warning("Heartbeat timeout, reconnecting...")
                     self.http.loop.create_task(self.reconnect())
                     break
-                data = {"op": gateway.Opcodes.HEARTBEAT, "d": self.seq}
-                self._ping_start = time.time()
-                await self.ws.send_json(data)  # Don't track rate limit for this.
-                self.last_heartbeat_send = time.time()
-                await asyncio.sleep(self.heartbeat_interval / 1000)
+                payload = prefix + ("null" if self.seq is None else str(self.seq)) + "}"
+                self._ping_start = monotonic()
+                await send_str(payload)  # Don't track rate limit for this.
+                self.last_heartbeat_send = monotonic()
+                await sleep(interval_s)
         except asyncio.CancelledError:
             return
 
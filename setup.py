@@ -22,6 +22,6 @@ setuptools.setup(
     include_package_data=True,
     python_requires=">=3.7",
     install_requires=install_requires,
-    extras_require={"voice": ["PyNaCl"], "dev": dev_requires},
+    extras_require={"voice": ["PyNaCl"], "speed": ["orjson"], "dev": dev_requires},
     classifiers=["Programming Language :: Python :: 3"],
 )